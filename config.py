@@ -5,6 +5,7 @@ Este arquivo permite personalizar o comportamento do sistema sem modificar o có
 
 import os
 import json
+from contextlib import contextmanager
 from typing import Dict, Any, Optional
 import logging
 
@@ -66,7 +67,8 @@ DEFAULT_CONFIG = {
         "validate_on_save": True,
         "validate_on_edit": True,
         "strict_type_checking": True,
-        "allow_extra_fields": False
+        "allow_extra_fields": False,
+        "fail_fast": False  # Interrompe a validação no primeiro erro
     }
 }
 
@@ -78,6 +80,7 @@ class Config:
     
     _instance = None
     _config = None
+    _suspended = False
     
     def __new__(cls):
         """Implementa padrão Singleton."""
@@ -163,9 +166,72 @@ class Config:
         
         # Definir o valor
         config[parts[-1]] = value
+
+        # Invalidar o cache de leituras memoizadas
+        invalidate_config_cache()
     
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna todas as configurações como um dicionário plano de chaves
+        em notação de ponto (ex: {"ui.window_width": 1000, ...}).
+
+        Útil para ler muitos valores de uma vez sem repetir a travessia
+        do dicionário aninhado a cada chamada de get().
+
+        Returns:
+            Dicionário plano com todas as folhas da configuração.
+        """
+        flat = {}
+
+        def _flatten(prefix: str, node: Dict) -> None:
+            for key, value in node.items():
+                dotted = f"{prefix}.{key}" if prefix else key
+                if isinstance(value, dict):
+                    _flatten(dotted, value)
+                else:
+                    flat[dotted] = value
+
+        _flatten("", self._config)
+        return flat
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager que agrupa várias alterações em uma única escrita.
+
+        Dentro do bloco, chamadas a set() apenas alteram o dicionário em
+        memória; a persistência em disco acontece uma vez na saída.
+
+        Uso:
+            with config.batch():
+                config.set("ui.font_size", 12)
+                config.set("ui.window_width", 1200)
+        """
+        self._suspended = True
+        try:
+            yield self
+        finally:
+            self._suspended = False
+            self.save()
+
+    def update(self, mapping: Dict[str, Any]) -> None:
+        """
+        Define vários valores de configuração de uma vez e salva no disco
+        com uma única escrita.
+
+        Args:
+            mapping: Dicionário de chaves em notação de ponto para valores.
+        """
+        with self.batch():
+            for key, value in mapping.items():
+                self.set(key, value)
+
     def save(self) -> None:
         """Salva as configurações no arquivo de configuração do usuário."""
+        # Dentro de batch(), adiar a escrita para a saída do bloco
+        if self._suspended:
+            return
+
         try:
             with open(USER_CONFIG_PATH, 'w', encoding='utf-8') as f:
                 json.dump(self._config, f, indent=2, ensure_ascii=False)
@@ -176,7 +242,8 @@ class Config:
     def reset(self) -> None:
         """Redefine as configurações para os valores padrão."""
         self._config = DEFAULT_CONFIG.copy()
-        
+        invalidate_config_cache()
+
         # Se houver um arquivo de configuração do usuário, removê-lo
         if os.path.exists(USER_CONFIG_PATH):
             try:
@@ -192,16 +259,33 @@ class Config:
 # Instância global para acesso às configurações
 config = Config()
 
+# Cache de get_config: evita repetir a travessia do caminho pontilhado a
+# cada chamada. Invalidado sempre que a configuração muda.
+_MISSING = object()
+_get_config_cache: Dict[str, Any] = {}
+
+def invalidate_config_cache() -> None:
+    """Limpa o cache de get_config após alterações na configuração."""
+    _get_config_cache.clear()
+
 # Função de conveniência para acessar configurações
 def get_config(key: str, default: Any = None) -> Any:
     """
     Função auxiliar para obter um valor de configuração.
-    
+
     Args:
         key: Chave usando notação de ponto (ex: "ui.dark_mode_default")
         default: Valor padrão se a chave não existir
-        
+
     Returns:
         Valor da configuração ou default se não encontrado
     """
-    return config.get(key, default)
\ No newline at end of file
+    value = _get_config_cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = config.get(key, _MISSING)
+        if value is _MISSING:
+            # Chave ausente: devolver o default sem cachear, pois o
+            # default pode variar entre chamadores
+            return default
+        _get_config_cache[key] = value
+    return value
\ No newline at end of file
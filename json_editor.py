@@ -13,6 +13,30 @@ from json_model import JsonModel, JsonModelError
 from json_utils import save_json_with_backup, is_json_file_large
 from config import get_config
 
+# orjson é opcional: quando instalado, serializa/desserializa JSON em
+# código nativo, bem mais rápido que o módulo json puro-Python
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Serializações pré-computadas dos valores vazios mais comuns, para não
+# chamar o serializador a cada célula com lista/dicionário vazio
+_EMPTY_LIST_JSON = "[]"
+_EMPTY_DICT_JSON = "{}"
+
+def _json_dumps(value: Any) -> str:
+    """Serializa um valor em texto JSON usando orjson quando disponível."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False)
+
+def _json_deep_copy(value: Any) -> Any:
+    """Copia profundamente um valor via round-trip JSON."""
+    if orjson is not None:
+        return orjson.loads(orjson.dumps(value))
+    return json.loads(json.dumps(value))
+
 class HistoryManager:
     """Gerenciador de histórico para operações de desfazer/refazer."""
     
@@ -1071,51 +1095,56 @@ class JsonEditorApp:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                
-            # Verificar se é uma lista ou um objeto
-            if isinstance(data, list):
-                self.data = data
-            else:
-                # Se for um objeto, verificar se tem alguma propriedade que é uma lista
-                for key, value in data.items():
-                    if isinstance(value, list):
-                        self.data = value
-                        break
-                else:
-                    # Se não encontrar uma lista, converter o objeto em um item único
-                    self.data = [data]
-            
+
+            self.load_data_records(data, source_name=os.path.basename(file_path))
             self.data_file_path = file_path
-            
-            # Atualizar status
-            data_name = os.path.basename(file_path)
-            current_status = self.status_var.get()
-            if current_status.startswith("Modelo:"):
-                self.status_var.set(f"{current_status} | Dados: {data_name}")
-            else:
-                self.status_var.set(f"Dados: {data_name}")
-            
-            # Adicionar ao histórico
-            self.add_to_history()
-            
-            # Se o modelo já estiver carregado, atualizar a árvore
-            if self.json_model:
-                self.update_tree()
-                self.validate_data()
-            else:
-                messagebox.showinfo(
-                    "Dados carregados", 
-                    "Dados carregados, mas nenhum modelo definido. "
-                    "Por favor, carregue um arquivo de modelo."
-                )
-                
+
         except Exception as e:
             messagebox.showerror(
-                "Erro ao carregar dados", 
+                "Erro ao carregar dados",
                 f"Não foi possível carregar os dados: {str(e)}"
             )
             traceback.print_exc()
-    
+
+    def load_data_records(self, records, source_name=None):
+        """Carrega dados já em memória (lista de registros ou objeto JSON)."""
+        # Verificar se é uma lista ou um objeto
+        if isinstance(records, list):
+            self.data = records
+        else:
+            # Se for um objeto, verificar se tem alguma propriedade que é uma lista
+            for key, value in records.items():
+                if isinstance(value, list):
+                    self.data = value
+                    break
+            else:
+                # Se não encontrar uma lista, converter o objeto em um item único
+                self.data = [records]
+
+        self.data_file_path = None
+
+        # Atualizar status
+        if source_name:
+            current_status = self.status_var.get()
+            if current_status.startswith("Modelo:"):
+                self.status_var.set(f"{current_status} | Dados: {source_name}")
+            else:
+                self.status_var.set(f"Dados: {source_name}")
+
+        # Adicionar ao histórico
+        self.add_to_history()
+
+        # Se o modelo já estiver carregado, atualizar a árvore
+        if self.json_model:
+            self.update_tree()
+            self.validate_data()
+        else:
+            messagebox.showinfo(
+                "Dados carregados",
+                "Dados carregados, mas nenhum modelo definido. "
+                "Por favor, carregue um arquivo de modelo."
+            )
+
     def setup_tree(self):
         """Configura o Treeview com base no modelo carregado."""
         # Limpar treeview existente
@@ -1177,9 +1206,12 @@ class JsonEditorApp:
                     
                     # Formatação especial para alguns tipos
                     if isinstance(value, (list, dict)):
-                        value = json.dumps(value, ensure_ascii=False)
-                        if len(value) > 50:
-                            value = value[:47] + "..."
+                        if not value:
+                            value = _EMPTY_LIST_JSON if isinstance(value, list) else _EMPTY_DICT_JSON
+                        else:
+                            value = _json_dumps(value)
+                            if len(value) > 50:
+                                value = value[:47] + "..."
                             
                     values.append(value)
                 else:
@@ -1234,16 +1266,14 @@ class JsonEditorApp:
         new_entry = self.json_model.create_empty_entry()
         
         # Abrir diálogo para preencher todos os campos de uma vez
-        dialog = self.MultiFieldEditDialog(
+        # (open() é modal e reaproveita a instância entre aberturas)
+        dialog = self.MultiFieldEditDialog.open(
             self.root,
             self.json_model,
             new_entry,
             self.theme
         )
-        
-        # Esperar pelo fechamento do diálogo
-        self.root.wait_window(dialog)
-        
+
         # Verificar se o usuário confirmou ou cancelou
         if dialog.result:
             # Usar os valores informados pelo usuário
@@ -1292,17 +1322,15 @@ class JsonEditorApp:
         # Se nenhuma coluna específica foi clicada ou foi um duplo clique sem foco em coluna,
         # abrir o diálogo para editar todos os campos de uma vez
         if not column or column == "#0":
-            # Usar o novo diálogo multi-campo
-            dialog = self.MultiFieldEditDialog(
+            # Usar o novo diálogo multi-campo (open() é modal e
+            # reaproveita a instância entre aberturas)
+            dialog = self.MultiFieldEditDialog.open(
                 self.root,
                 self.json_model,
                 entry,
                 self.theme
             )
-            
-            # Esperar pelo fechamento do diálogo
-            self.root.wait_window(dialog)
-            
+
             # Processar resultado
             if dialog.result:
                 # Atualizar a entrada com todos os valores de uma vez
@@ -1583,7 +1611,7 @@ class JsonEditorApp:
     def add_to_history(self):
         """Adiciona o estado atual ao histórico."""
         # Criar cópia profunda dos dados para o histórico
-        state = json.loads(json.dumps(self.data))
+        state = _json_deep_copy(self.data)
         self.history.add(state)
     
     def undo(self):
@@ -23,17 +23,38 @@ class JsonModel:
         "object": dict,
     }
     
+    # Nomes amigáveis dos tipos internos de lista, usados nas mensagens
+    # de erro do validador pré-compilado
+    LIST_TYPE_LABELS = {
+        "str": "string",
+        "int": "inteiro",
+        "float": "número",
+        "bool": "booleano",
+    }
+
+    # Verificações de tipo por item de lista, resolvidas com uma única
+    # consulta de dicionário em vez de uma cadeia if/elif. Como bool é
+    # subclasse de int em Python, int e float excluem booleanos
+    # explicitamente
+    _INNER_CHECK = {
+        "str": lambda v: isinstance(v, str),
+        "int": lambda v: isinstance(v, int) and not isinstance(v, bool),
+        "float": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+        "bool": lambda v: isinstance(v, bool),
+    }
+
     def __init__(self, model_path: str = None, model_dict: Dict = None):
         """
         Inicializa o modelo JSON.
-        
+
         Args:
             model_path: Caminho para o arquivo de modelo.
             model_dict: Dicionário contendo o modelo (alternativa ao arquivo).
         """
         self.model_path = model_path
         self.meta = {}
-        
+        self._compiled_validator = None
+
         if model_path and os.path.exists(model_path):
             self.load_model_from_file(model_path)
         elif model_dict:
@@ -58,6 +79,7 @@ class JsonModel:
                 
             self.meta = model_data["__meta__"]
             self.model_path = file_path
+            self._compiled_validator = None
             self._validate_meta()
             
         except json.JSONDecodeError:
@@ -79,6 +101,7 @@ class JsonModel:
             raise JsonModelError("O dicionário de modelo não contém a seção __meta__")
             
         self.meta = model_dict["__meta__"]
+        self._compiled_validator = None
         self._validate_meta()
     
     def _validate_meta(self) -> None:
@@ -226,6 +249,69 @@ class JsonModel:
         
         return errors
     
+    def compile_validator(self):
+        """
+        Pré-compila o modelo em uma função de validação especializada.
+
+        Percorre __meta__ uma única vez e gera uma lista de verificações
+        por campo (obrigatoriedade e tipos internos de listas tipadas);
+        a função retornada apenas executa essas verificações, sem
+        reinterpretar o esquema a cada chamada. O resultado é memoizado
+        na instância, de modo que salvamentos repetidos reutilizam o
+        mesmo validador.
+
+        Returns:
+            Função que recebe um dicionário de entrada e retorna a
+            lista de mensagens de erro.
+        """
+        if self._compiled_validator is not None:
+            return self._compiled_validator
+
+        checks = []
+
+        for field_name, field_spec in self.meta.items():
+            field_type = field_spec["type"]
+
+            if field_spec.get("required", False):
+                def check_required(entry, errors, field_name=field_name):
+                    value = entry.get(field_name)
+                    if value is None or (isinstance(value, str) and value.strip() == ""):
+                        errors.append(f"O campo '{field_name}' é obrigatório")
+
+                checks.append(check_required)
+
+            if field_type.startswith("list[") and field_type.endswith("]"):
+                inner_type = field_type[5:-1]
+                if inner_type in self._INNER_CHECK:
+                    check_item = self._INNER_CHECK[inner_type]
+                    label = self.LIST_TYPE_LABELS[inner_type]
+
+                    def check_list(entry, errors, field_name=field_name,
+                                   check_item=check_item, label=label):
+                        value = entry.get(field_name)
+                        if not value:
+                            return
+
+                        # Caminho rápido: all(map(...)) percorre a lista em
+                        # C; só re-enumerar para apontar os índices quando
+                        # algum item falha
+                        if not all(map(check_item, value)):
+                            for i, item in enumerate(value):
+                                if not check_item(item):
+                                    errors.append(
+                                        f"Item {i} em '{field_name}' deve ser do tipo {label}")
+
+                    checks.append(check_list)
+
+        def validate(entry):
+            errors = []
+            for check in checks:
+                check(entry, errors)
+            return errors
+
+        self._compiled_validator = validate
+        return validate
+
     def validate_data(self, data: List[Dict]) -> Dict[int, List[str]]:
         """
         Valida uma lista de entradas contra o modelo.
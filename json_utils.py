@@ -134,23 +134,25 @@ def save_json_with_backup(data: Any, file_path: str, indent: int = 2) -> None:
     except Exception as e:
         raise JsonProcessingError(f"Erro ao salvar arquivo JSON {file_path}: {str(e)}")
 
-def convert_csv_to_json(csv_file_path: str, json_file_path: str, 
-                        delimiter: str = ',', has_header: bool = True) -> None:
+def read_csv_to_records(csv_file_path: str, delimiter: str = ',',
+                        has_header: bool = True) -> List[Dict]:
     """
-    Converte um arquivo CSV para JSON.
-    
+    Lê um arquivo CSV e retorna os registros como uma lista de dicionários.
+
     Args:
         csv_file_path: Caminho para o arquivo CSV de entrada
-        json_file_path: Caminho para o arquivo JSON de saída
         delimiter: Delimitador usado no CSV
         has_header: Se True, a primeira linha é tratada como cabeçalho
-        
+
+    Returns:
+        Lista de dicionários, um por linha do CSV
+
     Raises:
-        JsonProcessingError: Se ocorrer um erro durante a conversão
+        JsonProcessingError: Se ocorrer um erro durante a leitura
     """
     try:
         import csv
-        
+
         with open(csv_file_path, 'r', encoding='utf-8', newline='') as csv_file:
             csv_reader = csv.reader(csv_file, delimiter=delimiter)
             
@@ -178,71 +180,87 @@ def convert_csv_to_json(csv_file_path: str, json_file_path: str,
                 entry = {}
                 for i, value in enumerate(row):
                     if i < len(headers):
-                        # Tentar converter para tipo apropriado
-                        try:
+                        # Tentar converter para tipo apropriado. Os testes abaixo
+                        # só falhariam se value não fosse string, então um guard
+                        # explícito substitui o try/except genérico.
+                        if isinstance(value, str):
+                            lower_value = value.lower()
                             # Tentar como número
                             if value.isdigit():
                                 entry[headers[i]] = int(value)
                             elif value.replace('.', '', 1).isdigit():
                                 entry[headers[i]] = float(value)
                             # Tentar como booleano
-                            elif value.lower() in ['true', 'yes', 'sim', '1']:
+                            elif lower_value in ('true', 'yes', 'sim', '1'):
                                 entry[headers[i]] = True
-                            elif value.lower() in ['false', 'no', 'não', '0']:
+                            elif lower_value in ('false', 'no', 'não', '0'):
                                 entry[headers[i]] = False
                             # Caso contrário, manter como string
                             else:
                                 entry[headers[i]] = value
-                        except:
-                            # Em caso de erro, manter como string
+                        else:
+                            # Valor não textual: manter como está
                             entry[headers[i]] = value
                 
                 data.append(entry)
-            
-            # Salvar como JSON
-            with open(json_file_path, 'w', encoding='utf-8') as json_file:
-                json.dump(data, json_file, ensure_ascii=False, indent=2)
-                
-            logger.info(f"Arquivo CSV convertido para JSON: {json_file_path}")
-            
+
+            return data
+
+    except Exception as e:
+        if isinstance(e, JsonProcessingError):
+            raise
+        raise JsonProcessingError(f"Erro ao ler arquivo CSV {csv_file_path}: {str(e)}")
+
+def convert_csv_to_json(csv_file_path: str, json_file_path: str,
+                        delimiter: str = ',', has_header: bool = True) -> None:
+    """
+    Converte um arquivo CSV para JSON.
+
+    Args:
+        csv_file_path: Caminho para o arquivo CSV de entrada
+        json_file_path: Caminho para o arquivo JSON de saída
+        delimiter: Delimitador usado no CSV
+        has_header: Se True, a primeira linha é tratada como cabeçalho
+
+    Raises:
+        JsonProcessingError: Se ocorrer um erro durante a conversão
+    """
+    try:
+        data = read_csv_to_records(csv_file_path, delimiter, has_header)
+
+        # Salvar como JSON
+        with open(json_file_path, 'w', encoding='utf-8') as json_file:
+            json.dump(data, json_file, ensure_ascii=False, indent=2)
+
+        logger.info(f"Arquivo CSV convertido para JSON: {json_file_path}")
+
     except Exception as e:
+        if isinstance(e, JsonProcessingError):
+            raise
         raise JsonProcessingError(f"Erro ao converter CSV para JSON: {str(e)}")
 
-def convert_json_to_csv(json_file_path: str, csv_file_path: str, 
-                        delimiter: str = ',', include_header: bool = True) -> None:
+def write_csv_from_records(records: List[Dict], csv_file_path: str,
+                           delimiter: str = ',', include_header: bool = True) -> None:
     """
-    Converte um arquivo JSON para CSV.
-    
+    Escreve uma lista de registros já em memória em um arquivo CSV.
+
+    Evita a serialização intermediária para JSON quando os dados já
+    estão carregados como lista de dicionários.
+
     Args:
-        json_file_path: Caminho para o arquivo JSON de entrada
+        records: Lista de dicionários a serem escritos
         csv_file_path: Caminho para o arquivo CSV de saída
         delimiter: Delimitador a ser usado no CSV
         include_header: Se True, inclui linha de cabeçalho
-        
+
     Raises:
-        JsonProcessingError: Se ocorrer um erro durante a conversão
+        JsonProcessingError: Se ocorrer um erro durante a escrita
     """
     try:
         import csv
-        
-        # Carregar dados JSON
-        with open(json_file_path, 'r', encoding='utf-8') as json_file:
-            data = json.load(json_file)
-        
-        # Garantir que temos uma lista de objetos
-        if not isinstance(data, list):
-            if isinstance(data, dict):
-                # Encontrar uma lista dentro do objeto, se houver
-                for key, value in data.items():
-                    if isinstance(value, list):
-                        data = value
-                        break
-                else:
-                    # Se não encontrar uma lista, transformar o próprio objeto em uma lista
-                    data = [data]
-            else:
-                raise JsonProcessingError("O arquivo JSON não contém uma lista ou objeto")
-        
+
+        data = records
+
         if not data:
             logger.warning("Lista JSON vazia, criando arquivo CSV vazio")
             with open(csv_file_path, 'w', encoding='utf-8', newline='') as csv_file:
@@ -274,9 +292,53 @@ def convert_json_to_csv(json_file_path: str, csv_file_path: str,
                     # Se o item não for um dicionário, escrever como valor único
                     csv_writer.writerow([str(item)])
         
+        logger.info(f"Registros escritos em CSV: {csv_file_path}")
+
+    except Exception as e:
+        if isinstance(e, JsonProcessingError):
+            raise
+        raise JsonProcessingError(f"Erro ao escrever CSV {csv_file_path}: {str(e)}")
+
+def convert_json_to_csv(json_file_path: str, csv_file_path: str,
+                        delimiter: str = ',', include_header: bool = True) -> None:
+    """
+    Converte um arquivo JSON para CSV.
+
+    Args:
+        json_file_path: Caminho para o arquivo JSON de entrada
+        csv_file_path: Caminho para o arquivo CSV de saída
+        delimiter: Delimitador a ser usado no CSV
+        include_header: Se True, inclui linha de cabeçalho
+
+    Raises:
+        JsonProcessingError: Se ocorrer um erro durante a conversão
+    """
+    try:
+        # Carregar dados JSON
+        with open(json_file_path, 'r', encoding='utf-8') as json_file:
+            data = json.load(json_file)
+
+        # Garantir que temos uma lista de objetos
+        if not isinstance(data, list):
+            if isinstance(data, dict):
+                # Encontrar uma lista dentro do objeto, se houver
+                for key, value in data.items():
+                    if isinstance(value, list):
+                        data = value
+                        break
+                else:
+                    # Se não encontrar uma lista, transformar o próprio objeto em uma lista
+                    data = [data]
+            else:
+                raise JsonProcessingError("O arquivo JSON não contém uma lista ou objeto")
+
+        write_csv_from_records(data, csv_file_path, delimiter, include_header)
+
         logger.info(f"Arquivo JSON convertido para CSV: {csv_file_path}")
-        
+
     except Exception as e:
+        if isinstance(e, JsonProcessingError):
+            raise
         raise JsonProcessingError(f"Erro ao converter JSON para CSV: {str(e)}")
 
 def validate_json_schema(data: Dict, schema: Dict) -> List[str]:
@@ -297,7 +359,8 @@ def validate_json_schema(data: Dict, schema: Dict) -> List[str]:
         return ["Esquema não contém seção __meta__"]
     
     meta = schema["__meta__"]
-    
+    defined_fields = frozenset(meta)
+
     # Validar campos obrigatórios
     for field_name, field_spec in meta.items():
         if not isinstance(field_spec, dict):
@@ -358,11 +421,10 @@ def validate_json_schema(data: Dict, schema: Dict) -> List[str]:
             if not valid and not errors:  # Evitar mensagem duplicada
                 errors.append(f"Valor do campo '{field_name}' não corresponde ao tipo {field_type}")
     
-    # Verificar campos extras
-    for field_name in data:
-        if field_name not in meta:
-            errors.append(f"Campo '{field_name}' não está definido no esquema")
-    
+    # Verificar campos extras (diferença de conjuntos em C, sem loop Python)
+    extras = data.keys() - defined_fields
+    errors.extend(f"Campo '{field_name}' não está definido no esquema" for field_name in sorted(extras))
+
     return errors
 
 def is_json_file_large(file_path: str, threshold_mb: float = 10.0) -> bool:
@@ -1,39 +1,56 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+from tkinter import font as tkfont
 import os
 import json
 import sys
+from functools import partial
 from json_editor import JsonEditorApp
 from json_model import JsonModel, JsonModelError
+from json_utils import read_csv_to_records, write_csv_from_records
 from config import config, get_config
 
 class ConfigDialog(tk.Toplevel):
     """Diálogo para edição de configurações do sistema."""
     
+    # Tamanho inicial do diálogo, conhecido a priori para centralizar
+    # sem forçar um passe de layout
+    WINDOW_WIDTH = 600
+    WINDOW_HEIGHT = 500
+
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
         self.title("Configurações")
-        self.geometry("600x500")
         self.resizable(True, True)
         
         # Tornar modal
         self.transient(parent)
         self.grab_set()
         
+        # Capturar todas as configurações de uma vez; as abas leem deste
+        # snapshot em vez de repetir get_config() por widget
+        self._cfg = config.snapshot()
+
+        # Registro de campos: chave de configuração -> (widget/variável, conversor).
+        # Os valores são lidos daqui no save(), dispensando uma tk.Variable
+        # por widget para spinboxes, comboboxes e entries
+        self._fields = {}
+
         # Configurar tema
-        self.is_dark_mode = get_config("ui.dark_mode_default", False)
+        self.is_dark_mode = self._cfg.get("ui.dark_mode_default", False)
         
         # Configurar interface
         self.setup_ui()
         
-        # Centralizar
-        self.update_idletasks()
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
-        x = (screen_width - self.winfo_width()) // 2
-        y = (screen_height - self.winfo_height()) // 2
-        self.geometry(f"+{x}+{y}")
+        # Centralizar usando o tamanho conhecido e as dimensões de tela
+        # cacheadas na raiz, sem update_idletasks() (que forçaria um
+        # passe completo de layout antes de a janela aparecer)
+        screen_width = getattr(parent, "_screen_w", None) or self.winfo_screenwidth()
+        screen_height = getattr(parent, "_screen_h", None) or self.winfo_screenheight()
+        x = (screen_width - self.WINDOW_WIDTH) // 2
+        y = (screen_height - self.WINDOW_HEIGHT) // 2
+        self.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}+{x}+{y}")
     
     def setup_ui(self):
         """Configura a interface do diálogo de configurações."""
@@ -57,22 +74,23 @@ class ConfigDialog(tk.Toplevel):
         notebook.add(validation_frame, text="Validação")
         notebook.add(export_frame, text="Exportação")
         notebook.add(directories_frame, text="Diretórios")
-        
-        # Configurações de Interface
-        self.setup_ui_tab(ui_frame)
-        
-        # Configurações de Arquivos
-        self.setup_files_tab(files_frame)
-        
-        # Configurações de Validação
-        self.setup_validation_tab(validation_frame)
-        
-        # Configurações de Exportação
-        self.setup_export_tab(export_frame)
-        
-        # Configurações de Diretórios
-        self.setup_directories_tab(directories_frame)
-        
+
+        # Construção preguiçosa: os widgets de cada aba só são criados na
+        # primeira vez em que a aba é exibida
+        self._tab_builders = {
+            str(ui_frame): (ui_frame, self.setup_ui_tab),
+            str(files_frame): (files_frame, self.setup_files_tab),
+            str(validation_frame): (validation_frame, self.setup_validation_tab),
+            str(export_frame): (export_frame, self.setup_export_tab),
+            str(directories_frame): (directories_frame, self.setup_directories_tab),
+        }
+        self._built_tabs = set()
+        self._notebook = notebook
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        # Construir imediatamente a primeira aba visível
+        self._build_tab(notebook.select())
+
         # Botões
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill="x", pady=(10, 0))
@@ -90,11 +108,45 @@ class ConfigDialog(tk.Toplevel):
         ).pack(side="right", padx=5)
         
         ttk.Button(
-            button_frame, 
-            text="Salvar", 
+            button_frame,
+            text="Salvar",
             command=self.save
         ).pack(side="right")
-    
+
+    def _on_tab_changed(self, event):
+        """Constrói a aba selecionada na primeira visualização."""
+        self._build_tab(event.widget.select())
+
+    def _build_tab(self, tab_id):
+        """Executa o construtor da aba indicada, se ainda não executado."""
+        if tab_id in self._built_tabs:
+            return
+
+        entry = self._tab_builders.get(tab_id)
+        if entry is not None:
+            frame, builder = entry
+            self._built_tabs.add(tab_id)
+            builder(frame)
+
+    def _register(self, key, source, convert=None):
+        """
+        Registra a origem do valor de uma configuração.
+
+        Args:
+            key: Chave de configuração em notação de ponto.
+            source: Widget ou variável com método get().
+            convert: Função opcional para converter o valor lido.
+        """
+        self._fields[key] = (source, convert)
+
+    def _make_checkbutton(self, parent, text, key, default):
+        """Cria um Checkbutton registrado (o estado exige uma BooleanVar)."""
+        var = tk.BooleanVar(value=self._cfg.get(key, default))
+        check = ttk.Checkbutton(parent, text=text, variable=var)
+        check.var = var  # Manter referência viva à variável
+        self._register(key, var)
+        return check
+
     def setup_ui_tab(self, parent):
         """Configura a aba de Interface."""
         # Tamanho da janela
@@ -102,97 +154,69 @@ class ConfigDialog(tk.Toplevel):
         size_frame.pack(fill="x", pady=5)
         
         ttk.Label(size_frame, text="Largura:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        self.width_var = tk.IntVar(value=get_config("ui.window_width", 1000))
-        ttk.Spinbox(
-            size_frame, 
-            from_=800, 
-            to=1920, 
-            increment=50, 
-            textvariable=self.width_var
-        ).grid(row=0, column=1, sticky="ew", padx=5, pady=5)
-        
+        width_spin = ttk.Spinbox(size_frame, from_=800, to=1920, increment=50)
+        width_spin.set(self._cfg.get("ui.window_width", 1000))
+        width_spin.grid(row=0, column=1, sticky="ew", padx=5, pady=5)
+        self._register("ui.window_width", width_spin, int)
+
         ttk.Label(size_frame, text="Altura:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        self.height_var = tk.IntVar(value=get_config("ui.window_height", 700))
-        ttk.Spinbox(
-            size_frame, 
-            from_=600, 
-            to=1080, 
-            increment=50, 
-            textvariable=self.height_var
-        ).grid(row=1, column=1, sticky="ew", padx=5, pady=5)
-        
+        height_spin = ttk.Spinbox(size_frame, from_=600, to=1080, increment=50)
+        height_spin.set(self._cfg.get("ui.window_height", 700))
+        height_spin.grid(row=1, column=1, sticky="ew", padx=5, pady=5)
+        self._register("ui.window_height", height_spin, int)
+
         size_frame.grid_columnconfigure(1, weight=1)
-        
+
         # Tema e aparência
         theme_frame = ttk.LabelFrame(parent, text="Tema e Aparência", padding=10)
         theme_frame.pack(fill="x", pady=5)
-        
-        self.dark_mode_var = tk.BooleanVar(value=get_config("ui.dark_mode_default", False))
-        ttk.Checkbutton(
-            theme_frame, 
-            text="Usar tema escuro por padrão", 
-            variable=self.dark_mode_var
+
+        self._make_checkbutton(
+            theme_frame, "Usar tema escuro por padrão",
+            "ui.dark_mode_default", False
         ).pack(anchor="w", pady=2)
-        
-        self.show_tooltips_var = tk.BooleanVar(value=get_config("ui.show_tooltips", True))
-        ttk.Checkbutton(
-            theme_frame, 
-            text="Mostrar dicas de ferramentas", 
-            variable=self.show_tooltips_var
+
+        self._make_checkbutton(
+            theme_frame, "Mostrar dicas de ferramentas",
+            "ui.show_tooltips", True
         ).pack(anchor="w", pady=2)
-        
-        self.show_types_var = tk.BooleanVar(value=get_config("ui.show_field_types_in_headers", True))
-        ttk.Checkbutton(
-            theme_frame, 
-            text="Mostrar tipos nos cabeçalhos", 
-            variable=self.show_types_var
+
+        self._make_checkbutton(
+            theme_frame, "Mostrar tipos nos cabeçalhos",
+            "ui.show_field_types_in_headers", True
         ).pack(anchor="w", pady=2)
-        
+
         # Fonte
         font_frame = ttk.LabelFrame(parent, text="Fonte", padding=10)
         font_frame.pack(fill="x", pady=5)
-        
+
         ttk.Label(font_frame, text="Tamanho da fonte:").pack(side="left", padx=5)
-        
-        self.font_size_var = tk.IntVar(value=get_config("ui.font_size", 10))
-        ttk.Spinbox(
-            font_frame, 
-            from_=8, 
-            to=16, 
-            increment=1, 
-            textvariable=self.font_size_var,
-            width=5
-        ).pack(side="left", padx=5)
-        
+
+        font_spin = ttk.Spinbox(font_frame, from_=8, to=16, increment=1, width=5)
+        font_spin.set(self._cfg.get("ui.font_size", 10))
+        font_spin.pack(side="left", padx=5)
+        self._register("ui.font_size", font_spin, int)
+
         # Comportamento
         behavior_frame = ttk.LabelFrame(parent, text="Comportamento", padding=10)
         behavior_frame.pack(fill="x", pady=5)
-        
-        self.drag_drop_var = tk.BooleanVar(value=get_config("ui.enable_drag_drop", True))
-        ttk.Checkbutton(
-            behavior_frame, 
-            text="Habilitar arrastar e soltar arquivos", 
-            variable=self.drag_drop_var
+
+        self._make_checkbutton(
+            behavior_frame, "Habilitar arrastar e soltar arquivos",
+            "ui.enable_drag_drop", True
         ).pack(anchor="w", pady=2)
-        
-        self.confirm_delete_var = tk.BooleanVar(value=get_config("ui.confirm_before_delete", True))
-        ttk.Checkbutton(
-            behavior_frame, 
-            text="Confirmar antes de excluir", 
-            variable=self.confirm_delete_var
+
+        self._make_checkbutton(
+            behavior_frame, "Confirmar antes de excluir",
+            "ui.confirm_before_delete", True
         ).pack(anchor="w", pady=2)
-        
+
         ttk.Label(behavior_frame, text="Tamanho máximo do histórico:").pack(anchor="w", pady=2)
-        
-        self.history_size_var = tk.IntVar(value=get_config("ui.max_history_size", 50))
-        ttk.Spinbox(
-            behavior_frame, 
-            from_=10, 
-            to=200, 
-            increment=10, 
-            textvariable=self.history_size_var,
-            width=5
-        ).pack(anchor="w", padx=20, pady=2)
+
+        history_spin = ttk.Spinbox(behavior_frame, from_=10, to=200, increment=10, width=5)
+        history_spin.set(self._cfg.get("ui.max_history_size", 50))
+        history_spin.pack(anchor="w", padx=20, pady=2)
+        self._register("ui.max_history_size", history_spin, int)
     
     def setup_files_tab(self, parent):
         """Configura a aba de Arquivos."""
@@ -200,73 +224,57 @@ class ConfigDialog(tk.Toplevel):
         backup_frame = ttk.LabelFrame(parent, text="Backup e Salvamento", padding=10)
         backup_frame.pack(fill="x", pady=5)
         
-        self.create_backups_var = tk.BooleanVar(value=get_config("files.create_backups", True))
-        ttk.Checkbutton(
-            backup_frame, 
-            text="Criar backups antes de salvar", 
-            variable=self.create_backups_var
+        self._make_checkbutton(
+            backup_frame, "Criar backups antes de salvar",
+            "files.create_backups", True
         ).pack(anchor="w", pady=2)
-        
+
         ttk.Label(backup_frame, text="Intervalo de salvamento automático (segundos):").pack(anchor="w", pady=2)
         ttk.Label(backup_frame, text="0 = desativado").pack(anchor="w", padx=20, pady=0)
-        
-        self.auto_save_var = tk.IntVar(value=get_config("files.auto_save_interval", 300))
-        ttk.Spinbox(
-            backup_frame, 
-            from_=0, 
-            to=3600, 
-            increment=60, 
-            textvariable=self.auto_save_var,
-            width=5
-        ).pack(anchor="w", padx=20, pady=2)
-        
+
+        auto_save_spin = ttk.Spinbox(backup_frame, from_=0, to=3600, increment=60, width=5)
+        auto_save_spin.set(self._cfg.get("files.auto_save_interval", 300))
+        auto_save_spin.pack(anchor="w", padx=20, pady=2)
+        self._register("files.auto_save_interval", auto_save_spin, int)
+
         # Arquivos grandes
         large_files_frame = ttk.LabelFrame(parent, text="Arquivos Grandes", padding=10)
         large_files_frame.pack(fill="x", pady=5)
-        
+
         ttk.Label(large_files_frame, text="Limite para considerar arquivo grande (MB):").pack(anchor="w", pady=2)
-        
-        self.large_file_var = tk.DoubleVar(value=get_config("files.large_file_threshold_mb", 10.0))
-        ttk.Spinbox(
-            large_files_frame, 
-            from_=1, 
-            to=100, 
-            increment=1, 
-            textvariable=self.large_file_var,
-            width=5
-        ).pack(anchor="w", padx=20, pady=2)
-        
+
+        large_file_spin = ttk.Spinbox(large_files_frame, from_=1, to=100, increment=1, width=5)
+        large_file_spin.set(self._cfg.get("files.large_file_threshold_mb", 10.0))
+        large_file_spin.pack(anchor="w", padx=20, pady=2)
+        self._register("files.large_file_threshold_mb", large_file_spin, float)
+
         # Codificação
         encoding_frame = ttk.LabelFrame(parent, text="Codificação", padding=10)
         encoding_frame.pack(fill="x", pady=5)
-        
+
         ttk.Label(encoding_frame, text="Codificação padrão:").pack(side="left", padx=5)
-        
-        self.encoding_var = tk.StringVar(value=get_config("files.default_encoding", "utf-8"))
+
         encodings = ["utf-8", "utf-16", "latin-1", "ascii", "cp1252"]
-        ttk.Combobox(
-            encoding_frame, 
-            textvariable=self.encoding_var,
+        encoding_combo = ttk.Combobox(
+            encoding_frame,
             values=encodings,
             state="readonly",
             width=10
-        ).pack(side="left", padx=5)
-        
+        )
+        encoding_combo.set(self._cfg.get("files.default_encoding", "utf-8"))
+        encoding_combo.pack(side="left", padx=5)
+        self._register("files.default_encoding", encoding_combo)
+
         # Arquivos recentes
         recent_frame = ttk.LabelFrame(parent, text="Arquivos Recentes", padding=10)
         recent_frame.pack(fill="x", pady=5)
-        
+
         ttk.Label(recent_frame, text="Número de arquivos recentes para lembrar:").pack(anchor="w", pady=2)
-        
-        self.recent_files_var = tk.IntVar(value=get_config("files.recent_files_count", 10))
-        ttk.Spinbox(
-            recent_frame, 
-            from_=0, 
-            to=30, 
-            increment=1, 
-            textvariable=self.recent_files_var,
-            width=5
-        ).pack(anchor="w", padx=20, pady=2)
+
+        recent_spin = ttk.Spinbox(recent_frame, from_=0, to=30, increment=1, width=5)
+        recent_spin.set(self._cfg.get("files.recent_files_count", 10))
+        recent_spin.pack(anchor="w", padx=20, pady=2)
+        self._register("files.recent_files_count", recent_spin, int)
     
     def setup_validation_tab(self, parent):
         """Configura a aba de Validação."""
@@ -274,43 +282,33 @@ class ConfigDialog(tk.Toplevel):
         when_frame = ttk.LabelFrame(parent, text="Quando Validar", padding=10)
         when_frame.pack(fill="x", pady=5)
         
-        self.validate_load_var = tk.BooleanVar(value=get_config("validation.validate_on_load", True))
-        ttk.Checkbutton(
-            when_frame, 
-            text="Validar ao carregar arquivo", 
-            variable=self.validate_load_var
+        self._make_checkbutton(
+            when_frame, "Validar ao carregar arquivo",
+            "validation.validate_on_load", True
         ).pack(anchor="w", pady=2)
-        
-        self.validate_save_var = tk.BooleanVar(value=get_config("validation.validate_on_save", True))
-        ttk.Checkbutton(
-            when_frame, 
-            text="Validar antes de salvar", 
-            variable=self.validate_save_var
+
+        self._make_checkbutton(
+            when_frame, "Validar antes de salvar",
+            "validation.validate_on_save", True
         ).pack(anchor="w", pady=2)
-        
-        self.validate_edit_var = tk.BooleanVar(value=get_config("validation.validate_on_edit", True))
-        ttk.Checkbutton(
-            when_frame, 
-            text="Validar ao editar campos", 
-            variable=self.validate_edit_var
+
+        self._make_checkbutton(
+            when_frame, "Validar ao editar campos",
+            "validation.validate_on_edit", True
         ).pack(anchor="w", pady=2)
-        
+
         # Comportamento da validação
         behavior_frame = ttk.LabelFrame(parent, text="Comportamento da Validação", padding=10)
         behavior_frame.pack(fill="x", pady=5)
-        
-        self.strict_type_var = tk.BooleanVar(value=get_config("validation.strict_type_checking", True))
-        ttk.Checkbutton(
-            behavior_frame, 
-            text="Verificação estrita de tipos", 
-            variable=self.strict_type_var
+
+        self._make_checkbutton(
+            behavior_frame, "Verificação estrita de tipos",
+            "validation.strict_type_checking", True
         ).pack(anchor="w", pady=2)
-        
-        self.allow_extra_var = tk.BooleanVar(value=get_config("validation.allow_extra_fields", False))
-        ttk.Checkbutton(
-            behavior_frame, 
-            text="Permitir campos extras não definidos no modelo", 
-            variable=self.allow_extra_var
+
+        self._make_checkbutton(
+            behavior_frame, "Permitir campos extras não definidos no modelo",
+            "validation.allow_extra_fields", False
         ).pack(anchor="w", pady=2)
     
     def setup_export_tab(self, parent):
@@ -321,77 +319,71 @@ class ConfigDialog(tk.Toplevel):
         
         ttk.Label(json_frame, text="Indentação padrão (espaços):").pack(anchor="w", pady=2)
         
-        self.json_indent_var = tk.IntVar(value=get_config("export.default_json_indent", 2))
-        ttk.Spinbox(
-            json_frame, 
-            from_=0, 
-            to=8, 
-            increment=1, 
-            textvariable=self.json_indent_var,
-            width=5
-        ).pack(anchor="w", padx=20, pady=2)
-        
+        indent_spin = ttk.Spinbox(json_frame, from_=0, to=8, increment=1, width=5)
+        indent_spin.set(self._cfg.get("export.default_json_indent", 2))
+        indent_spin.pack(anchor="w", padx=20, pady=2)
+        self._register("export.default_json_indent", indent_spin, int)
+
         # CSV
         csv_frame = ttk.LabelFrame(parent, text="CSV", padding=10)
         csv_frame.pack(fill="x", pady=5)
-        
+
         ttk.Label(csv_frame, text="Delimitador:").pack(side="left", padx=5)
-        
-        self.csv_delimiter_var = tk.StringVar(value=get_config("export.csv_delimiter", ","))
+
         delimiters = [",", ";", "\t", "|", " "]
-        ttk.Combobox(
-            csv_frame, 
-            textvariable=self.csv_delimiter_var,
-            values=delimiters,
-            width=5
-        ).pack(side="left", padx=5)
-        
-        self.csv_header_var = tk.BooleanVar(value=get_config("export.csv_include_header", True))
-        ttk.Checkbutton(
-            csv_frame, 
-            text="Incluir cabeçalho", 
-            variable=self.csv_header_var
+        delimiter_combo = ttk.Combobox(csv_frame, values=delimiters, width=5)
+        delimiter_combo.set(self._cfg.get("export.csv_delimiter", ","))
+        delimiter_combo.pack(side="left", padx=5)
+        self._register("export.csv_delimiter", delimiter_combo)
+
+        self._make_checkbutton(
+            csv_frame, "Incluir cabeçalho",
+            "export.csv_include_header", True
         ).pack(side="left", padx=20)
-        
+
         # Excel
         excel_frame = ttk.LabelFrame(parent, text="Excel", padding=10)
         excel_frame.pack(fill="x", pady=5)
-        
+
         ttk.Label(excel_frame, text="Nome da planilha padrão:").pack(side="left", padx=5)
-        
-        self.excel_sheet_var = tk.StringVar(value=get_config("export.excel_sheet_name", "JSON Data"))
-        ttk.Entry(
-            excel_frame, 
-            textvariable=self.excel_sheet_var,
-            width=20
-        ).pack(side="left", padx=5)
+
+        sheet_entry = ttk.Entry(excel_frame, width=20)
+        sheet_entry.insert(0, self._cfg.get("export.excel_sheet_name", "JSON Data"))
+        sheet_entry.pack(side="left", padx=5)
+        self._register("export.excel_sheet_name", sheet_entry)
     
     def setup_directories_tab(self, parent):
         """Configura a aba de Diretórios."""
-        dirs = get_config("directories", {})
+        dirs = {
+            key.split(".", 1)[1]: value
+            for key, value in self._cfg.items()
+            if key.startswith("directories.")
+        }
         
         # Frame para diretórios
         dirs_frame = ttk.Frame(parent, padding=10)
         dirs_frame.pack(fill="both", expand=True)
         
-        # Variáveis para cada diretório
-        self.dir_vars = {}
-        
+        # Entradas para cada diretório
+        self.dir_entries = {}
+
         # Adicionar campos para cada diretório
         row = 0
         for dir_name, dir_path in dirs.items():
             ttk.Label(dirs_frame, text=f"{dir_name.capitalize()}:").grid(
                 row=row, column=0, sticky="w", padx=5, pady=5
             )
-            
-            self.dir_vars[dir_name] = tk.StringVar(value=dir_path)
-            entry = ttk.Entry(dirs_frame, textvariable=self.dir_vars[dir_name], width=40)
+
+            entry = ttk.Entry(dirs_frame, width=40)
+            entry.insert(0, dir_path)
             entry.grid(row=row, column=1, sticky="ew", padx=5, pady=5)
-            
+            self.dir_entries[dir_name] = entry
+            self._register(f"directories.{dir_name}", entry)
+
             ttk.Button(
-                dirs_frame, 
-                text="Selecionar", 
-                command=lambda name=dir_name: self.select_directory(name)
+                dirs_frame,
+                text="Selecionar",
+                command=partial(self.select_directory, dir_name)
             ).grid(row=row, column=2, padx=5, pady=5)
             
             row += 1
@@ -407,58 +399,62 @@ class ConfigDialog(tk.Toplevel):
     
     def select_directory(self, dir_name):
         """Abre diálogo para selecionar diretório."""
-        current_path = self.dir_vars[dir_name].get()
+        entry = self.dir_entries[dir_name]
+        current_path = entry.get()
         new_path = filedialog.askdirectory(initialdir=current_path)
-        
+
         if new_path:
-            self.dir_vars[dir_name].set(new_path)
+            entry.delete(0, "end")
+            entry.insert(0, new_path)
     
     def save(self):
         """Salva as configurações e fecha o diálogo."""
-        # Interface
-        config.set("ui.window_width", self.width_var.get())
-        config.set("ui.window_height", self.height_var.get())
-        config.set("ui.dark_mode_default", self.dark_mode_var.get())
-        config.set("ui.show_tooltips", self.show_tooltips_var.get())
-        config.set("ui.show_field_types_in_headers", self.show_types_var.get())
-        config.set("ui.font_size", self.font_size_var.get())
-        config.set("ui.enable_drag_drop", self.drag_drop_var.get())
-        config.set("ui.confirm_before_delete", self.confirm_delete_var.get())
-        config.set("ui.max_history_size", self.history_size_var.get())
-        
-        # Arquivos
-        config.set("files.create_backups", self.create_backups_var.get())
-        config.set("files.auto_save_interval", self.auto_save_var.get())
-        config.set("files.large_file_threshold_mb", self.large_file_var.get())
-        config.set("files.default_encoding", self.encoding_var.get())
-        config.set("files.recent_files_count", self.recent_files_var.get())
-        
-        # Validação
-        config.set("validation.validate_on_load", self.validate_load_var.get())
-        config.set("validation.validate_on_save", self.validate_save_var.get())
-        config.set("validation.validate_on_edit", self.validate_edit_var.get())
-        config.set("validation.strict_type_checking", self.strict_type_var.get())
-        config.set("validation.allow_extra_fields", self.allow_extra_var.get())
-        
-        # Exportação
-        config.set("export.default_json_indent", self.json_indent_var.get())
-        config.set("export.csv_delimiter", self.csv_delimiter_var.get())
-        config.set("export.csv_include_header", self.csv_header_var.get())
-        config.set("export.excel_sheet_name", self.excel_sheet_var.get())
-        
-        # Diretórios
-        for dir_name, var in self.dir_vars.items():
-            config.set(f"directories.{dir_name}", var.get())
-        
-        # Salvar configurações
-        config.save()
-        
-        # Fechar diálogo
-        self.destroy()
-    
+        # Ler os valores diretamente dos widgets/variáveis registrados;
+        # abas não construídas não têm campos registrados nem alterações
+        updates = {}
+        for key, (source, convert) in self._fields.items():
+            value = source.get()
+            if convert is not None:
+                value = convert(value)
+            updates[key] = value
+
+        # Aplicar tudo e salvar em uma única escrita
+        config.update(updates)
+
+        # Ocultar diálogo (a instância é reutilizada na próxima abertura)
+        self.grab_release()
+        self.withdraw()
+
     def cancel(self):
-        """Cancela as alterações e fecha o diálogo."""
-        self.destroy()
+        """Fecha o diálogo sem salvar as alterações."""
+        self.grab_release()
+        self.withdraw()
+
+    def reopen(self):
+        """
+        Reexibe a instância oculta descartando edições canceladas.
+
+        Como os widgets são reaproveitados entre aberturas, os campos
+        registrados são repopulados a partir de um snapshot novo da
+        configuração antes de a janela reaparecer; abas ainda não
+        construídas lerão o snapshot atualizado em seus construtores.
+        """
+        self._cfg = config.snapshot()
+        for key, (source, convert) in self._fields.items():
+            value = self._cfg.get(key)
+            if value is None:
+                continue
+            if hasattr(source, "set"):
+                # BooleanVar, Spinbox e Combobox
+                source.set(value)
+            else:
+                # Entry simples
+                source.delete(0, "end")
+                source.insert(0, value)
+
+        self.deiconify()
+        self.lift()
+        self.grab_set()
     
     def reset_defaults(self):
         """Redefine as configurações para os valores padrão."""
@@ -479,164 +475,237 @@ class ConfigDialog(tk.Toplevel):
 
 def main():
     """Função principal para iniciar a aplicação."""
-    root = tk.Tk()
-    root.title("Editor de Banco de Dados JSON")
-    
-    # Verificar e criar diretórios necessários
+    # Preparar diretórios e arquivos de exemplo antes de iniciar o Tk;
+    # com --no-ui a execução termina aqui, sem pagar o custo de carregar
+    # Tcl/Tk (útil para gerar os exemplos em scripts/CI)
     create_required_directories()
-    
-    # Verificar e criar arquivos de exemplo se não existirem
     check_example_files()
-    
+
+    if "--no-ui" in sys.argv:
+        return
+
+    root = tk.Tk()
+    root.title("Editor de Banco de Dados JSON")
+
+    # Configurar fonte e estilos uma única vez: widgets criados depois
+    # resolvem a fonte pelo nome, sem recomputar métricas por widget, e
+    # os diálogos compartilham a mesma instância de ttk.Style
+    tkfont.nametofont("TkDefaultFont").configure(size=get_config("ui.font_size", 10))
+    style = ttk.Style(root)
+    style.configure("DialogTitle.TLabel", font=("", 16, "bold"))
+    style.configure("DialogSubtitle.TLabel", font=("", 14, "bold"))
+    root._style = style
+
     # Obter dimensões da janela a partir das configurações
     window_width = get_config("ui.window_width", 1000)
     window_height = get_config("ui.window_height", 700)
     
+    # Cachear dimensões da tela na raiz; cada winfo_screen* faz um
+    # round-trip ao servidor gráfico e o valor não muda durante a sessão
+    root._screen_w = root.winfo_screenwidth()
+    root._screen_h = root.winfo_screenheight()
+
     # Centralizar janela
-    screen_width = root.winfo_screenwidth()
-    screen_height = root.winfo_screenheight()
-    x = (screen_width - window_width) // 2
-    y = (screen_height - window_height) // 2
+    x = (root._screen_w - window_width) // 2
+    y = (root._screen_h - window_height) // 2
     root.geometry(f"{window_width}x{window_height}+{x}+{y}")
     
     # Criar menu
     create_menu(root)
-    
-    # Iniciar a aplicação
-    app = JsonEditorApp(root)
-    
-    # Guardar referência global
-    root.app = app
-    
+
+    # Placeholder leve exibido até a construção da aplicação
+    loading_label = ttk.Label(root, text="Carregando...")
+    loading_label.pack(expand=True)
+
+    # Adiar a construção pesada da aplicação para depois do primeiro
+    # paint da janela, reduzindo a latência percebida de inicialização
+    def build_app():
+        loading_label.destroy()
+        root.app = JsonEditorApp(root)
+
+    root.after_idle(build_app)
+
     # Iniciar loop principal
     root.mainloop()
 
 def create_required_directories():
     """Cria os diretórios necessários para a aplicação."""
-    for dir_name, dir_path in get_config("directories", {}).items():
-        os.makedirs(dir_path, exist_ok=True)
+    paths = set(get_config("directories", {}).values())
+
+    # os.makedirs já cria os ancestrais, então diretórios que são
+    # ancestrais de outro configurado não precisam de chamada própria
+    for path in paths:
+        is_ancestor = any(
+            other != path and other.startswith(path + os.sep)
+            for other in paths
+        )
+        if not is_ancestor:
+            os.makedirs(path, exist_ok=True)
+
+# Conteúdo dos arquivos de exemplo, já serializado: como nunca muda, é
+# escrito direto no disco sem passar pelo encoder JSON em tempo de execução
+_EXAMPLE_MODEL_JSON = """\
+{
+  "__meta__": {
+    "name": {"type": "str", "required": true},
+    "email": {"type": "str", "required": false},
+    "age": {"type": "int", "required": false},
+    "active": {"type": "bool", "required": true},
+    "tags": {"type": "list[str]", "required": false},
+    "address": {"type": "dict", "required": false}
+  }
+}
+"""
+
+_EXAMPLE_DATA_JSON = """\
+[
+  {
+    "name": "João Silva",
+    "email": "joao@exemplo.com",
+    "age": 30,
+    "active": true,
+    "tags": ["cliente", "premium"],
+    "address": {
+      "street": "Rua Exemplo",
+      "number": 123,
+      "city": "São Paulo"
+    }
+  },
+  {
+    "name": "Maria Oliveira",
+    "email": "maria@exemplo.com",
+    "age": 25,
+    "active": true,
+    "tags": ["cliente", "normal"],
+    "address": {
+      "street": "Avenida Teste",
+      "number": 456,
+      "city": "Rio de Janeiro"
+    }
+  },
+  {
+    "name": "Pedro Santos",
+    "active": false
+  }
+]
+"""
 
 def check_example_files():
     """Verifica e cria arquivos de exemplo se necessário."""
     # Obter diretório de exemplos
     examples_dir = get_config("directories.examples", "examples")
     os.makedirs(examples_dir, exist_ok=True)
-    
+
+    # Uma única leitura do diretório substitui um stat() por arquivo;
+    # na inicialização típica os exemplos já existem e nada é alocado
+    existing_files = {entry.name for entry in os.scandir(examples_dir)}
+
     # Criar arquivo de modelo de exemplo
-    example_model_path = os.path.join(examples_dir, "example_model.json")
-    if not os.path.exists(example_model_path):
-        example_model = {
-            "__meta__": {
-                "name": {"type": "str", "required": True},
-                "email": {"type": "str", "required": False},
-                "age": {"type": "int", "required": False},
-                "active": {"type": "bool", "required": True},
-                "tags": {"type": "list[str]", "required": False},
-                "address": {"type": "dict", "required": False}
-            }
-        }
-        
+    if "example_model.json" not in existing_files:
+        example_model_path = os.path.join(examples_dir, "example_model.json")
         with open(example_model_path, 'w', encoding='utf-8') as f:
-            json.dump(example_model, f, indent=2, ensure_ascii=False)
-    
+            f.write(_EXAMPLE_MODEL_JSON)
+
     # Criar arquivo de dados de exemplo
-    example_data_path = os.path.join(examples_dir, "example_data.json")
-    if not os.path.exists(example_data_path):
-        example_data = [
-            {
-                "name": "João Silva",
-                "email": "joao@exemplo.com",
-                "age": 30,
-                "active": True,
-                "tags": ["cliente", "premium"],
-                "address": {
-                    "street": "Rua Exemplo",
-                    "number": 123,
-                    "city": "São Paulo"
-                }
-            },
-            {
-                "name": "Maria Oliveira",
-                "email": "maria@exemplo.com",
-                "age": 25,
-                "active": True,
-                "tags": ["cliente", "normal"],
-                "address": {
-                    "street": "Avenida Teste",
-                    "number": 456,
-                    "city": "Rio de Janeiro"
-                }
-            },
-            {
-                "name": "Pedro Santos",
-                "active": False
-            }
-        ]
-        
+    if "example_data.json" not in existing_files:
+        example_data_path = os.path.join(examples_dir, "example_data.json")
         with open(example_data_path, 'w', encoding='utf-8') as f:
-            json.dump(example_data, f, indent=2, ensure_ascii=False)
+            f.write(_EXAMPLE_DATA_JSON)
+
+def _app_call(root, method_name):
+    """Invoca um método do app, se a aplicação já estiver construída."""
+    app = getattr(root, "app", None)
+    if app is not None:
+        getattr(app, method_name)()
+
+def _tool_call(root, func):
+    """Invoca uma função de ferramenta passando o app, se já construído."""
+    app = getattr(root, "app", None)
+    if app is not None:
+        func(app)
+
+def _focus_search(root):
+    """Coloca o foco no campo de pesquisa do app, se já construído."""
+    app = getattr(root, "app", None)
+    if app is not None:
+        app.search_entry.focus_set()
 
 def create_menu(root):
     """Cria o menu principal."""
+    # Menu já construído para esta janela: nada a fazer
+    if getattr(root, "_menu_bar", None) is not None:
+        return
+
     menu_bar = tk.Menu(root)
     root.config(menu=menu_bar)
-    
+    root._menu_bar = menu_bar
+
+    # partial() evita uma closure por item de menu; cada comando compartilha
+    # os mesmos despachantes de módulo
+
     # Menu Arquivo
     file_menu = tk.Menu(menu_bar, tearoff=0)
     menu_bar.add_cascade(label="Arquivo", menu=file_menu)
-    
-    file_menu.add_command(label="Carregar Modelo", command=lambda: root.app.load_model_file())
-    file_menu.add_command(label="Carregar Dados", command=lambda: root.app.load_data_file())
+
+    file_menu.add_command(label="Carregar Modelo", command=partial(_app_call, root, "load_model_file"))
+    file_menu.add_command(label="Carregar Dados", command=partial(_app_call, root, "load_data_file"))
     file_menu.add_separator()
-    file_menu.add_command(label="Salvar", command=lambda: root.app.save_data())
-    file_menu.add_command(label="Salvar Como...", command=lambda: root.app.save_data_as())
+    file_menu.add_command(label="Salvar", command=partial(_app_call, root, "save_data"))
+    file_menu.add_command(label="Salvar Como...", command=partial(_app_call, root, "save_data_as"))
     file_menu.add_separator()
     file_menu.add_command(label="Sair", command=root.quit)
-    
+
     # Menu Editar
     edit_menu = tk.Menu(menu_bar, tearoff=0)
     menu_bar.add_cascade(label="Editar", menu=edit_menu)
-    
-    edit_menu.add_command(label="Desfazer", command=lambda: root.app.undo())
-    edit_menu.add_command(label="Refazer", command=lambda: root.app.redo())
+
+    edit_menu.add_command(label="Desfazer", command=partial(_app_call, root, "undo"))
+    edit_menu.add_command(label="Refazer", command=partial(_app_call, root, "redo"))
     edit_menu.add_separator()
-    edit_menu.add_command(label="Adicionar Entrada", command=lambda: root.app.add_entry())
-    edit_menu.add_command(label="Editar Selecionada", command=lambda: root.app.edit_selected())
-    edit_menu.add_command(label="Excluir Selecionada", command=lambda: root.app.delete_selected())
+    edit_menu.add_command(label="Adicionar Entrada", command=partial(_app_call, root, "add_entry"))
+    edit_menu.add_command(label="Editar Selecionada", command=partial(_app_call, root, "edit_selected"))
+    edit_menu.add_command(label="Excluir Selecionada", command=partial(_app_call, root, "delete_selected"))
     edit_menu.add_separator()
-    edit_menu.add_command(label="Pesquisar", command=lambda: root.app.search_entry.focus_set())
-    
+    edit_menu.add_command(label="Pesquisar", command=partial(_focus_search, root))
+
     # Menu Ferramentas
     tools_menu = tk.Menu(menu_bar, tearoff=0)
     menu_bar.add_cascade(label="Ferramentas", menu=tools_menu)
-    
-    tools_menu.add_command(label="Validar Dados", command=lambda: root.app.validate_data())
+
+    tools_menu.add_command(label="Validar Dados", command=partial(_app_call, root, "validate_data"))
     tools_menu.add_separator()
-    tools_menu.add_command(label="Exportar para CSV", command=lambda: export_to_csv(root.app))
-    tools_menu.add_command(label="Importar de CSV", command=lambda: import_from_csv(root.app))
-    
+    tools_menu.add_command(label="Exportar para CSV", command=partial(_tool_call, root, export_to_csv))
+    tools_menu.add_command(label="Importar de CSV", command=partial(_tool_call, root, import_from_csv))
+
     # Menu Visualizar
     view_menu = tk.Menu(menu_bar, tearoff=0)
     menu_bar.add_cascade(label="Visualizar", menu=view_menu)
-    
-    view_menu.add_command(label="Alternar Tema", command=lambda: root.app.toggle_theme())
-    
+
+    view_menu.add_command(label="Alternar Tema", command=partial(_app_call, root, "toggle_theme"))
+
     # Menu Configurações
     settings_menu = tk.Menu(menu_bar, tearoff=0)
     menu_bar.add_cascade(label="Configurações", menu=settings_menu)
-    
-    settings_menu.add_command(label="Preferências", command=lambda: open_config_dialog(root))
-    
+
+    settings_menu.add_command(label="Preferências", command=partial(open_config_dialog, root))
+
     # Menu Ajuda
     help_menu = tk.Menu(menu_bar, tearoff=0)
     menu_bar.add_cascade(label="Ajuda", menu=help_menu)
-    
-    help_menu.add_command(label="Sobre", command=lambda: show_about_dialog(root))
-    help_menu.add_command(label="Ajuda", command=lambda: show_help(root))
+
+    help_menu.add_command(label="Sobre", command=partial(show_about_dialog, root))
+    help_menu.add_command(label="Ajuda", command=partial(show_help, root))
 
 def open_config_dialog(root):
-    """Abre o diálogo de configurações."""
-    ConfigDialog(root)
+    """Abre o diálogo de configurações, reutilizando a instância existente."""
+    dialog = getattr(root, "_cfg_dlg", None)
+    if dialog is None or not dialog.winfo_exists():
+        # Primeira abertura (ou diálogo destruído por reset): construir
+        root._cfg_dlg = ConfigDialog(root)
+    else:
+        # Reexibir a instância oculta sem reconstruir os widgets,
+        # repopulando os campos para descartar edições canceladas
+        dialog.reopen()
 
 def export_to_csv(app):
     """Exporta dados para CSV."""
@@ -655,23 +724,14 @@ def export_to_csv(app):
         return
         
     try:
-        from json_utils import convert_json_to_csv
-        
         # Obter configurações
         delimiter = get_config("export.csv_delimiter", ",")
         include_header = get_config("export.csv_include_header", True)
-        
-        # Criar arquivo temporário com os dados
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode="w+")
-        json.dump(app.data, temp_file, ensure_ascii=False)
-        temp_file.close()
-        
-        # Converter para CSV
-        convert_json_to_csv(temp_file.name, file_path, delimiter, include_header)
-        
-        # Remover arquivo temporário
-        os.unlink(temp_file.name)
-        
+
+        # Escrever diretamente a partir dos dados em memória,
+        # sem passar por um arquivo JSON temporário
+        write_csv_from_records(app.data, file_path, delimiter, include_header)
+
         messagebox.showinfo(
             "Exportação Concluída", 
             f"Dados exportados com sucesso para {file_path}."
@@ -703,113 +763,28 @@ def import_from_csv(app):
         return
         
     try:
-        from json_utils import convert_csv_to_json
-        
         # Obter configurações
         delimiter = get_config("export.csv_delimiter", ",")
-        
-        # Criar arquivo temporário para receber dados JSON
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".json")
-        temp_file.close()
-        
-        # Converter CSV para JSON
-        convert_csv_to_json(file_path, temp_file.name, delimiter, True)
-        
-        # Carregar dados
-        app.load_data_file(temp_file.name)
-        
-        # Remover arquivo temporário
-        os.unlink(temp_file.name)
-        
+
+        # Ler registros do CSV e carregá-los diretamente,
+        # sem passar por um arquivo JSON temporário
+        records = read_csv_to_records(file_path, delimiter, True)
+        app.load_data_records(records, source_name=os.path.basename(file_path))
+
     except Exception as e:
         messagebox.showerror(
             "Erro na Importação", 
             f"Não foi possível importar do CSV: {str(e)}"
         )
 
-def show_about_dialog(root):
-    """Mostra o diálogo 'Sobre'."""
-    about_window = tk.Toplevel(root)
-    about_window.title("Sobre")
-    about_window.geometry("400x300")
-    about_window.resizable(False, False)
-    
-    # Tornar modal
-    about_window.transient(root)
-    about_window.grab_set()
-    
-    # Título
-    title_label = ttk.Label(
-        about_window, 
-        text="Editor de Banco de Dados JSON",
-        font=("", 16, "bold")
-    )
-    title_label.pack(pady=(20, 10))
-    
-    # Versão
-    version_label = ttk.Label(about_window, text="Versão 1.0.0")
-    version_label.pack(pady=5)
-    
-    # Descrição
-    desc_text = (
-        "Um sistema para gerenciar arquivos JSON através de uma interface gráfica "
-        "amigável, com validação de esquema e recursos avançados de edição."
-    )
-    
-    desc_label = ttk.Label(about_window, text=desc_text, wraplength=350, justify="center")
-    desc_label.pack(pady=10, padx=20)
-    
-    # Créditos
-    credits_label = ttk.Label(
-        about_window, 
-        text="© 2025 JSON Database Editor",
-        foreground="gray"
-    )
-    credits_label.pack(pady=10)
-    
-    # Botão de fechar
-    close_button = ttk.Button(about_window, text="Fechar", command=about_window.destroy)
-    close_button.pack(pady=20)
-    
-    # Centralizar
-    about_window.update_idletasks()
-    x = root.winfo_rootx() + (root.winfo_width() - about_window.winfo_width()) // 2
-    y = root.winfo_rooty() + (root.winfo_height() - about_window.winfo_height()) // 2
-    about_window.geometry(f"+{x}+{y}")
+# Textos estáticos dos diálogos Sobre/Ajuda, alocados uma única vez no
+# import em vez de a cada abertura do diálogo
+_ABOUT_DESC = (
+    "Um sistema para gerenciar arquivos JSON através de uma interface gráfica "
+    "amigável, com validação de esquema e recursos avançados de edição."
+)
 
-def show_help(root):
-    """Mostra a ajuda."""
-    help_window = tk.Toplevel(root)
-    help_window.title("Ajuda")
-    help_window.geometry("600x500")
-    
-    # Tornar modal
-    help_window.transient(root)
-    help_window.grab_set()
-    
-    # Frame principal
-    main_frame = ttk.Frame(help_window, padding=10)
-    main_frame.pack(fill="both", expand=True)
-    
-    # Título
-    title_label = ttk.Label(
-        main_frame, 
-        text="Ajuda do Editor de Banco de Dados JSON",
-        font=("", 14, "bold")
-    )
-    title_label.pack(pady=(0, 10))
-    
-    # Conteúdo em um widget de texto com scroll
-    help_text = tk.Text(main_frame, wrap="word", height=20)
-    help_text.pack(fill="both", expand=True)
-    
-    # Barra de rolagem
-    scrollbar = ttk.Scrollbar(help_text, command=help_text.yview)
-    scrollbar.pack(side="right", fill="y")
-    help_text.configure(yscrollcommand=scrollbar.set)
-    
-    # Conteúdo da ajuda
-    help_content = """
+_HELP_CONTENT = """
 # Como Usar o Editor de Banco de Dados JSON
 
 ## Conceitos Básicos
@@ -889,18 +864,109 @@ Se encontrar algum problema:
 2. Verifique se o arquivo de dados segue a estrutura definida no modelo.
 3. Consulte o console para mensagens de erro detalhadas.
 """
+
+def show_about_dialog(root):
+    """Mostra o diálogo 'Sobre'."""
+    about_window = tk.Toplevel(root)
+    about_window.title("Sobre")
+    about_window.geometry("400x300")
+    about_window.resizable(False, False)
+    
+    # Tornar modal
+    about_window.transient(root)
+    about_window.grab_set()
+    
+    # Título
+    title_label = ttk.Label(
+        about_window,
+        text="Editor de Banco de Dados JSON",
+        style="DialogTitle.TLabel"
+    )
+    title_label.pack(pady=(20, 10))
+    
+    # Versão
+    version_label = ttk.Label(about_window, text="Versão 1.0.0")
+    version_label.pack(pady=5)
+    
+    # Descrição
+    desc_label = ttk.Label(about_window, text=_ABOUT_DESC, wraplength=350, justify="center")
+    desc_label.pack(pady=10, padx=20)
+    
+    # Créditos
+    credits_label = ttk.Label(
+        about_window, 
+        text="© 2025 JSON Database Editor",
+        foreground="gray"
+    )
+    credits_label.pack(pady=10)
+    
+    # Botão de fechar
+    close_button = ttk.Button(about_window, text="Fechar", command=about_window.destroy)
+    close_button.pack(pady=20)
+    
+    # Centralizar usando o tamanho conhecido (400x300), sem forçar layout
+    x = root.winfo_rootx() + (root.winfo_width() - 400) // 2
+    y = root.winfo_rooty() + (root.winfo_height() - 300) // 2
+    about_window.geometry(f"+{x}+{y}")
+
+def show_help(root):
+    """Mostra a ajuda."""
+    # Reutilizar a janela já construída: o layout do widget de texto
+    # (quebra de linhas) é caro e não muda entre aberturas
+    help_window = getattr(root, "_help_win", None)
+    if help_window is not None and help_window.winfo_exists():
+        help_window.deiconify()
+        help_window.lift()
+        help_window.grab_set()
+        return
+
+    help_window = tk.Toplevel(root)
+    help_window.title("Ajuda")
+    help_window.geometry("600x500")
+    root._help_win = help_window
+
+    # Tornar modal
+    help_window.transient(root)
+    help_window.grab_set()
+
+    # Fechar apenas oculta a janela, preservando o conteúdo renderizado
+    def close_help():
+        help_window.grab_release()
+        help_window.withdraw()
+
+    help_window.protocol("WM_DELETE_WINDOW", close_help)
+
+    # Frame principal
+    main_frame = ttk.Frame(help_window, padding=10)
+    main_frame.pack(fill="both", expand=True)
+    
+    # Título
+    title_label = ttk.Label(
+        main_frame,
+        text="Ajuda do Editor de Banco de Dados JSON",
+        style="DialogSubtitle.TLabel"
+    )
+    title_label.pack(pady=(0, 10))
+    
+    # Conteúdo em um widget de texto com scroll
+    help_text = tk.Text(main_frame, wrap="word", height=20)
+    help_text.pack(fill="both", expand=True)
+    
+    # Barra de rolagem
+    scrollbar = ttk.Scrollbar(help_text, command=help_text.yview)
+    scrollbar.pack(side="right", fill="y")
+    help_text.configure(yscrollcommand=scrollbar.set)
     
-    help_text.insert("1.0", help_content)
+    help_text.insert("1.0", _HELP_CONTENT)
     help_text.configure(state="disabled")  # Tornar somente leitura
     
     # Botão de fechar
-    close_button = ttk.Button(main_frame, text="Fechar", command=help_window.destroy)
+    close_button = ttk.Button(main_frame, text="Fechar", command=close_help)
     close_button.pack(pady=10)
     
-    # Centralizar
-    help_window.update_idletasks()
-    x = root.winfo_rootx() + (root.winfo_width() - help_window.winfo_width()) // 2
-    y = root.winfo_rooty() + (root.winfo_height() - help_window.winfo_height()) // 2
+    # Centralizar usando o tamanho conhecido (600x500), sem forçar layout
+    x = root.winfo_rootx() + (root.winfo_width() - 600) // 2
+    y = root.winfo_rooty() + (root.winfo_height() - 500) // 2
     help_window.geometry(f"+{x}+{y}")
 
 if __name__ == "__main__":
@@ -1,11 +1,111 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import json
+import re
+from dataclasses import dataclass
+from itertools import islice
 from typing import Any, Dict, List, Optional, Union
+from config import get_config
+
+# Literais aceitos nas conversões de texto para booleano: uma única
+# consulta de hash resolve o valor, em vez de duas varreduras de conjunto
+_BOOL_MAP = {
+    "true": True, "verdadeiro": True, "1": True, "sim": True, "s": True, "t": True,
+    "false": False, "falso": False, "0": False, "não": False, "nao": False,
+    "n": False, "f": False,
+}
+
+# Pré-filtro de valores numéricos: evita disparar ValueError em textos
+# claramente não numéricos durante a autodetecção de tipos
+_NUM_RE = re.compile(r"^-?\d+([.,]\d+)?$")
+
+# Tabela precomputada para normalizar vírgula decimal em ponto com uma
+# única passada em C (translate é inócuo quando não há vírgula)
+_COMMA_TO_DOT = str.maketrans(",", ".")
+
+def _to_entry_text(value):
+    """Converte um valor para o texto inicial de um Entry.
+
+    Strings passam direto, sem a cópia implícita de str(); None vira
+    string vazia. Usado em todos os pontos que preenchem Entries."""
+    if value is None:
+        return ""
+    return value if type(value) is str else str(value)
+
+# Validadores de digitação: aceitam estados intermediários ("", "-", "1.")
+# sem recorrer a int()/float() e à criação de ValueError a cada tecla
+
+@dataclass(slots=True)
+class _FieldEntry:
+    """
+    Metadados e widget de valor de um campo do diálogo.
+
+    Um dataclass com slots ocupa uma fração do dicionário por campo que
+    era usado antes, e o acesso por atributo é mais rápido que a
+    indexação de dicionário nos laços de leitura/salvamento.
+    """
+    widget: Any
+    type: str
+    required: bool
+    is_list: bool = False
+    inner_type: Optional[str] = None
 
 class MultiFieldEditDialog(tk.Toplevel):
     """Diálogo para edição de múltiplos campos de uma entrada JSON."""
-    
+
+    # A partir desta quantidade de itens, listas e dicionários genéricos
+    # usam um único tk.Text (uma linha por item) em vez de um Entry por
+    # item, reduzindo drasticamente a criação de widgets
+    TEXT_EDITOR_THRESHOLD = 25
+
+    # Quantidade de linhas de campos construídas imediatamente ao abrir o
+    # diálogo; as demais (fora da área visível) são construídas em lotes
+    # quando o laço de eventos fica ocioso
+    EAGER_FIELD_ROWS = 30
+    DEFERRED_BATCH_SIZE = 20
+
+    # Quantidade de linhas inseridas por lote ao preencher o editor de
+    # texto de listas/dicionários muito grandes
+    STREAM_CHUNK = 200
+
+    # Instâncias reaproveitadas entre aberturas, chaveadas pela janela
+    # pai e pelo modelo — a criação dos widgets Tk domina o tempo de
+    # abertura e passa a acontecer uma única vez por modelo
+    _instances = {}
+
+    @classmethod
+    def open(cls, parent, json_model, current_values=None, theme=None):
+        """
+        Abre o diálogo de forma modal e retorna a instância com result
+        preenchido (ou None, se cancelado).
+
+        Instâncias são reaproveitadas entre aberturas para o mesmo
+        modelo: fechar apenas oculta a janela e reabrir redefine os
+        valores dos widgets existentes, em vez de reconstruir tudo.
+        """
+        key = str(parent)
+        dialog = cls._instances.get(key)
+
+        # O diálogo em pool só vale enquanto o modelo for o mesmo: ao
+        # trocar de arquivo o app cria um JsonModel novo, e manter o
+        # Toplevel antigo acumularia uma árvore de widgets oculta (e uma
+        # referência ao modelo anterior) por modelo carregado
+        if (dialog is not None and dialog.winfo_exists()
+                and dialog.json_model is not json_model):
+            dialog.destroy()
+            dialog = None
+
+        if dialog is not None and dialog.winfo_exists():
+            dialog.reopen(current_values, theme)
+        else:
+            dialog = cls(parent, json_model, current_values, theme)
+            dialog._reusable = True
+            cls._instances[key] = dialog
+
+        dialog._closed.set(False)
+        dialog.wait_variable(dialog._closed)
+        return dialog
+
     def __init__(self, parent, json_model, current_values=None, theme=None):
         super().__init__(parent)
         self.parent = parent
@@ -14,14 +114,46 @@ class MultiFieldEditDialog(tk.Toplevel):
         self.theme = theme or {}
         self.result = None
         self.field_widgets = {}
-        
+
+        # Instâncias criadas via open() são ocultadas ao fechar e
+        # reaproveitadas; as demais continuam sendo destruídas
+        self._reusable = False
+        self._closed = tk.BooleanVar(self, value=False)
+
+        # Acúmulo de rolagem: ticks da roda do mouse são somados e
+        # aplicados uma vez por ciclo ocioso, coalescendo os redesenhos
+        # do canvas (trackpads emitem eventos em alta frequência)
+        self._pending_scroll = 0
+        self._scroll_scheduled = False
+
+        # Campos tocados pelo usuário: os demais devolvem o valor
+        # original em get_field_value, sem reconversão
+        self._dirty = set()
+        self._widget_field = {}
+
+        # BooleanVars indexadas pelo nome do campo, lidas direto ao salvar
+        self._bool_vars = {}
+
+        # Registrar cada validador uma única vez por diálogo, em vez de
+        # criar um comando Tcl novo a cada campo numérico
+        self._vcmd_int = (self.register(self.validate_int), '%P')
+        self._vcmd_float = (self.register(self.validate_float), '%P')
+
+        # Validador pré-compilado do modelo, reutilizado a cada save()
+        self._validator = json_model.compile_validator() if json_model else None
+
         self.setup_ui()
     
     def setup_ui(self):
         """Configura a interface do diálogo."""
         self.title("Editar Campos")
         self.configure(bg=self.theme.get("bg", "#F0F0F0"))
-        
+
+        # Construir a interface com a janela oculta: cada pack/grid em uma
+        # janela já mapeada dispara um novo cálculo de layout; ocultando,
+        # tudo é resolvido em um único layout no deiconify final
+        self.withdraw()
+
         # Usar grid para melhor controle do layout
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=1)
@@ -56,6 +188,7 @@ class MultiFieldEditDialog(tk.Toplevel):
         
         # Canvas para scroll
         canvas = tk.Canvas(main_frame, bg=self.theme.get("bg", "#F0F0F0"))
+        self._canvas = canvas
         canvas.grid(row=0, column=0, sticky="nsew")
         
         # Scrollbar
@@ -99,39 +232,29 @@ class MultiFieldEditDialog(tk.Toplevel):
         separator = ttk.Separator(content_frame, orient="horizontal")
         separator.grid(row=2, column=0, columnspan=3, sticky="ew", pady=5)
         
-        # Criar widgets para cada campo
-        row = 3
-        fields = self.json_model.get_field_names()
-        
-        for field in fields:
-            field_type = self.json_model.get_field_type(field)
-            is_required = self.json_model.is_field_required(field)
-            current_value = self.current_values.get(field)
-            
-            # Nome do campo (com indicador se é obrigatório)
-            field_label = ttk.Label(
-                content_frame,
-                text=f"{field} {'*' if is_required else ''}"
-            )
-            field_label.grid(row=row, column=0, padx=5, pady=5, sticky="nw")
-            
-            # Tipo do campo
-            type_label = ttk.Label(content_frame, text=field_type)
-            type_label.grid(row=row, column=1, padx=5, pady=5, sticky="nw")
-            
-            # Widget para o valor
-            value_widget = self.create_field_widget(content_frame, field_type, current_value)
-            value_widget.grid(row=row, column=2, padx=5, pady=5, sticky="ew")
-            
-            # Armazenar referência ao widget
-            self.field_widgets[field] = {
-                "widget": value_widget,
-                "type": field_type,
-                "required": is_required
-            }
-            
-            row += 1
-        
+        # Criar widgets para cada campo. Ler o __meta__ uma única vez e
+        # iterar diretamente sobre ele, em vez de consultar
+        # get_field_type/is_field_required (que re-percorrem o dicionário)
+        # por campo. Apenas a primeira tela de campos é construída de
+        # imediato; o restante (fora da área visível) é construído em
+        # lotes via after_idle, para que esquemas com centenas de campos
+        # abram o diálogo rapidamente
+        self._content_frame = content_frame
+        self._next_row = 3
+        self._pending_fields = []
+        self._pending_grid = []
+
+        for index, (field, field_spec) in enumerate(self.json_model.meta.items()):
+            if index < self.EAGER_FIELD_ROWS:
+                self._build_field_row(field, field_spec)
+            else:
+                self._pending_fields.append((field, field_spec))
+
+        self._flush_grid()
+
+        if self._pending_fields:
+            self.after_idle(self._build_deferred_rows)
+
         # Botões sempre visíveis na parte inferior
         button_frame = ttk.Frame(self)
         button_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=10)
@@ -148,38 +271,163 @@ class MultiFieldEditDialog(tk.Toplevel):
             command=self.save
         ).pack(side="right")
         
-        # Configurar redimensionamento do canvas
-        def configure_canvas(event):
+        # Configurar redimensionamento do canvas. Durante a construção em
+        # lotes cada linha dispara um <Configure>; recalcular o bbox em
+        # todos eles é desperdício, então um flag adia o recálculo para um
+        # único after_idle por rajada de eventos
+        self._bbox_dirty = False
+
+        def flush_bbox():
+            self._bbox_dirty = False
             canvas.configure(scrollregion=canvas.bbox("all"))
+
+        def configure_canvas(event):
             canvas.itemconfig(canvas_window, width=event.width)
+            if not self._bbox_dirty:
+                self._bbox_dirty = True
+                canvas.after_idle(flush_bbox)
+
+        content_frame.bind("<Configure>", configure_canvas, add="+")
         
-        content_frame.bind("<Configure>", configure_canvas)
-        
-        # Configurar scroll com o mouse
-        canvas.bind_all("<MouseWheel>", lambda event: canvas.yview_scroll(int(-1*(event.delta/120)), "units"))
+        # Configurar scroll com o mouse. O bind fica no próprio Toplevel:
+        # eventos de roda sobre qualquer descendente propagam até aqui
+        # pelas bindtags, ficam restritos a este diálogo (sem interceptar
+        # a rolagem da janela principal, como faria um bind_all) e morrem
+        # junto com a janela
+        def flush_scroll():
+            self._scroll_scheduled = False
+            delta, self._pending_scroll = self._pending_scroll, 0
+            if delta:
+                canvas.yview_scroll(delta, "units")
+
+        def on_mousewheel(event):
+            # Acumular os ticks e rolar uma única vez por ciclo ocioso
+            self._pending_scroll += int(-1 * (event.delta / 120))
+            if not self._scroll_scheduled:
+                self._scroll_scheduled = True
+                self.after_idle(flush_scroll)
+
+        self.bind("<MouseWheel>", on_mousewheel)
         
+        # Exibir a janela já com o layout completo
+        self.update_idletasks()
+        self.deiconify()
+
+        # Marcar como modificado o campo que recebeu digitação ou clique
+        # (o evento chega ao Toplevel pela bindtag da janela; o widget de
+        # origem é resolvido subindo a hierarquia até a linha do campo)
+        self.bind("<KeyRelease>", self._mark_dirty, add="+")
+        self.bind("<ButtonRelease-1>", self._mark_dirty, add="+")
+
+        # Fechar pelo botão da janela equivale a cancelar (necessário
+        # para liberar quem aguarda em open() quando a instância é
+        # reutilizável e não chega a ser destruída)
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+
         # Tornar modal
         self.transient(self.parent)
         self.grab_set()
         self.focus_set()
     
+    def _build_field_row(self, field, field_spec):
+        """Constrói a linha (rótulos e widget de valor) de um campo."""
+        content_frame = self._content_frame
+        row = self._next_row
+        field_type = field_spec["type"]
+        is_required = field_spec.get("required", False)
+        current_value = self.current_values.get(field)
+
+        # Nome do campo (com indicador se é obrigatório)
+        field_label = ttk.Label(
+            content_frame,
+            text=f"{field} {'*' if is_required else ''}"
+        )
+
+        # Tipo do campo
+        type_label = ttk.Label(content_frame, text=field_type)
+
+        # Widget para o valor
+        value_widget = self.create_field_widget(content_frame, field_type, current_value)
+
+        # Posicionamento adiado: os grids acumulados são aplicados de uma
+        # vez ao final do lote de linhas, em vez de um a um
+        self._pending_grid.append((field_label, row, 0, "nw"))
+        self._pending_grid.append((type_label, row, 1, "nw"))
+        self._pending_grid.append((value_widget, row, 2, "ew"))
+
+        # Mapear o widget de valor de volta ao campo, para o rastreio de
+        # campos modificados. As linhas de listas/dicts genéricos vivem
+        # num container irmão do widget composto (dentro do canvas com
+        # scrollbar), então o frame das linhas também precisa ser
+        # registrado para que a caminhada de _mark_dirty o alcance
+        self._widget_field[str(value_widget)] = field
+        inner_frame = (getattr(value_widget, "list_frame", None)
+                       or getattr(value_widget, "dict_frame", None))
+        if inner_frame is not None:
+            self._widget_field[str(inner_frame)] = field
+
+        # Armazenar referência ao widget, com o parse do tipo lista feito
+        # uma única vez (evita repetir startswith/fatia a cada leitura)
+        is_typed_list = field_type.startswith("list[") and field_type.endswith("]")
+        self.field_widgets[field] = _FieldEntry(
+            widget=value_widget,
+            type=field_type,
+            required=is_required,
+            is_list=field_type == "list" or is_typed_list,
+            inner_type=field_type[5:-1] if is_typed_list else None
+        )
+
+        # Guardar a BooleanVar pelo nome do campo para ler direto na
+        # hora de salvar, sem passar pelo widget
+        if field_type == "bool":
+            self._bool_vars[field] = value_widget.var
+
+        self._next_row = row + 1
+
+    def _build_deferred_rows(self):
+        """Constrói um lote de linhas adiadas e reagenda o restante."""
+        if not self.winfo_exists():
+            return
+
+        batch = self._pending_fields[:self.DEFERRED_BATCH_SIZE]
+        del self._pending_fields[:self.DEFERRED_BATCH_SIZE]
+
+        for field, field_spec in batch:
+            self._build_field_row(field, field_spec)
+
+        self._flush_grid()
+
+        if self._pending_fields:
+            self.after_idle(self._build_deferred_rows)
+
+    def _flush_deferred_rows(self):
+        """Constrói imediatamente todas as linhas ainda adiadas."""
+        while self._pending_fields:
+            field, field_spec = self._pending_fields.pop(0)
+            self._build_field_row(field, field_spec)
+        self._flush_grid()
+
+    def _flush_grid(self):
+        """Aplica de uma vez os posicionamentos de grade acumulados."""
+        for widget, row, column, sticky in self._pending_grid:
+            widget.grid(row=row, column=column, sticky=sticky, padx=5, pady=5)
+        self._pending_grid.clear()
+
     def create_field_widget(self, parent, field_type, current_value):
         """Cria o widget apropriado para o tipo do campo."""
         if field_type == "str":
             widget = ttk.Entry(parent)
-            widget.insert(0, str(current_value) if current_value is not None else "")
+            widget.insert(0, _to_entry_text(current_value))
             return widget
             
         elif field_type == "int":
-            vcmd = (self.register(self.validate_int), '%P')
-            widget = ttk.Entry(parent, validate="key", validatecommand=vcmd)
-            widget.insert(0, str(current_value) if current_value is not None else "0")
+            widget = ttk.Entry(parent, validate="key", validatecommand=self._vcmd_int)
+            widget.insert(0, _to_entry_text(current_value) if current_value is not None else "0")
             return widget
-            
+
         elif field_type == "float":
-            vcmd = (self.register(self.validate_float), '%P')
-            widget = ttk.Entry(parent, validate="key", validatecommand=vcmd)
-            widget.insert(0, str(current_value) if current_value is not None else "0.0")
+            widget = ttk.Entry(parent, validate="key", validatecommand=self._vcmd_float)
+            widget.insert(0, _to_entry_text(current_value) if current_value is not None else "0.0")
             return widget
             
         elif field_type == "bool":
@@ -189,6 +437,17 @@ class MultiFieldEditDialog(tk.Toplevel):
             return widget
             
         elif field_type == "list" or field_type.startswith("list["):
+            # Para listas grandes, um único tk.Text com uma linha por item
+            # substitui N frames e N entries
+            if (isinstance(current_value, list)
+                    and len(current_value) >= self.TEXT_EDITOR_THRESHOLD):
+                widget = tk.Text(parent, height=6, undo=True)
+                # Preencher em lotes: valores com milhares de itens não
+                # bloqueiam a abertura do diálogo
+                widget._line_iter = (str(item) for item in current_value)
+                self._stream_into_text(widget)
+                return widget
+
             # Criar um frame para a lista com scrollbar e altura limitada
             list_container = ttk.Frame(parent)
             canvas = tk.Canvas(list_container, height=100)
@@ -214,7 +473,14 @@ class MultiFieldEditDialog(tk.Toplevel):
             widget = ttk.Frame(parent)
             widget.list_frame = list_frame
             widget.entries = []
+            # Espelho em Python dos valores digitados, atualizado via
+            # eventos de teclado/foco para evitar um round-trip Tcl
+            # por Entry na hora de salvar
+            widget.value_list = []
             widget.canvas = canvas
+            # Pool de linhas removidas, reutilizadas em novas adições para
+            # evitar recriar Frame+Entry a cada item
+            widget.row_pool = []
             
             # Botões para adicionar/remover itens
             btn_frame = ttk.Frame(widget)
@@ -228,15 +494,22 @@ class MultiFieldEditDialog(tk.Toplevel):
             # Adicionar o container ao widget principal
             list_container.pack(fill="both", expand=True)
             
-            # Adicionar itens da lista atual
+            # Adicionar itens da lista atual com a propagação de geometria
+            # suspensa, atualizando a região de rolagem uma única vez ao
+            # final — cada pack deixa de disparar um recálculo em cascata
+            list_frame.pack_propagate(False)
+
             if current_value and isinstance(current_value, list):
                 for item in current_value:
-                    self.add_list_item(widget, list_frame, item)
-            
+                    self.add_list_item(widget, list_frame, item, _bulk=True)
+
             # Se a lista estiver vazia, adicionar um item em branco
             if not widget.entries:
-                self.add_list_item(widget, list_frame)
-                
+                self.add_list_item(widget, list_frame, _bulk=True)
+
+            list_frame.pack_propagate(True)
+            self._update_scroll_region(widget)
+
             return widget
                 
         elif field_type == "dict" or field_type == "object":
@@ -266,6 +539,7 @@ class MultiFieldEditDialog(tk.Toplevel):
                     
                 preview_label = ttk.Label(widget, text=dict_preview)
                 preview_label.pack(side="left", fill="x", expand=True)
+                widget.preview_label = preview_label
                 
                 edit_button = ttk.Button(
                     widget,
@@ -276,6 +550,17 @@ class MultiFieldEditDialog(tk.Toplevel):
                 
                 return widget
             else:
+                # Para dicionários grandes, um único tk.Text com uma linha
+                # "chave=valor" por par substitui 2N entries
+                if (isinstance(current_value, dict)
+                        and len(current_value) >= self.TEXT_EDITOR_THRESHOLD):
+                    widget = tk.Text(parent, height=6, undo=True)
+                    # Preencher em lotes, como no caso das listas grandes
+                    widget._line_iter = (
+                        f"{key}={value}" for key, value in current_value.items())
+                    self._stream_into_text(widget)
+                    return widget
+
                 # Usar interface genérica para pares chave-valor
                 # Criar um frame para o dicionário com scrollbar e altura limitada
                 dict_container = ttk.Frame(parent)
@@ -302,7 +587,12 @@ class MultiFieldEditDialog(tk.Toplevel):
                 widget = ttk.Frame(parent)
                 widget.dict_frame = dict_frame
                 widget.entries = []
+                # Espelhos em Python das chaves e valores digitados
+                widget.key_list = []
+                widget.val_list = []
                 widget.canvas = canvas
+                # Pool de linhas removidas, reutilizadas em novas adições
+                widget.row_pool = []
                 
                 # Botões para adicionar/remover pares
                 btn_frame = ttk.Frame(widget)
@@ -316,273 +606,516 @@ class MultiFieldEditDialog(tk.Toplevel):
                 # Adicionar o container ao widget principal
                 dict_container.pack(fill="both", expand=True)
                 
-                # Adicionar pares do dicionário atual
+                # Adicionar pares do dicionário atual com a propagação de
+                # geometria suspensa, atualizando a região de rolagem uma
+                # única vez ao final
+                dict_frame.pack_propagate(False)
+
                 if current_value and isinstance(current_value, dict):
                     for key, value in current_value.items():
-                        self.add_dict_pair(widget, dict_frame, key, value)
-                
+                        self.add_dict_pair(widget, dict_frame, key, value, _bulk=True)
+
                 # Se o dicionário estiver vazio, adicionar um par em branco
                 if not widget.entries:
-                    self.add_dict_pair(widget, dict_frame)
-                    
+                    self.add_dict_pair(widget, dict_frame, _bulk=True)
+
+                dict_frame.pack_propagate(True)
+                self._update_scroll_region(widget)
+
                 return widget
         
         # Caso padrão
         widget = ttk.Entry(parent)
-        widget.insert(0, str(current_value) if current_value is not None else "")
+        widget.insert(0, _to_entry_text(current_value))
         return widget
     
     def validate_int(self, value):
         """Valida entrada como número inteiro."""
-        if value == "" or value == "-":
-            return True
-            
-        try:
-            int(value)
-            return True
-        except ValueError:
-            return False
-    
+        s = value
+        if s[:1] == "-":
+            s = s[1:]
+        return s == "" or s.isdigit()
+
     def validate_float(self, value):
         """Valida entrada como número de ponto flutuante."""
-        if value == "" or value == "-" or value == "." or value == "-.":
-            return True
-            
-        try:
-            float(value)
-            return True
-        except ValueError:
+        s = value.translate(_COMMA_TO_DOT).lower()
+        if s[:1] == "-":
+            s = s[1:]
+        # Notação científica: float() aceita "1e5", então a digitação
+        # também deve aceitar (incluindo os estados parciais "1e"/"1e-")
+        mantissa, sep, exponent = s.partition("e")
+        if sep:
+            if exponent[:1] in ("+", "-"):
+                exponent = exponent[1:]
+            if exponent != "" and not exponent.isdigit():
+                return False
+        head, sep, tail = mantissa.partition(".")
+        if "." in tail:
             return False
+        return (head == "" or head.isdigit()) and (tail == "" or tail.isdigit())
     
     def get_field_value(self, field_name):
-        """Obtém o valor de um campo específico."""
+        """
+        Obtém o valor de um campo específico.
+
+        Erros de conversão são propagados ao chamador; save() os coleta
+        de todos os campos e exibe um único diálogo consolidado, em vez
+        de um messagebox modal por campo com problema.
+        """
         if field_name not in self.field_widgets:
             return None
-            
+
+        # Campo não tocado pelo usuário: devolver o valor original sem
+        # reler nem reconverter o conteúdo dos widgets. Originais None
+        # (entradas novas vêm de create_empty_entry com todos os campos
+        # em None) caem na leitura do widget, que exibe defaults válidos
+        # ("0", "0.0", checkbox desmarcado)
+        if field_name not in self._dirty:
+            original = self.current_values.get(field_name)
+            if original is not None:
+                return original
+
         field_info = self.field_widgets[field_name]
-        widget = field_info["widget"]
-        field_type = field_info["type"]
+        widget = field_info.widget
+        field_type = field_info.type
         
-        try:
-            if field_type == "str":
-                return widget.get()
-                
-            elif field_type == "int":
-                value = widget.get()
-                # Se o valor estiver vazio e não for um campo obrigatório, permitir null
-                if not value:
-                    is_required = field_info.get("required", False)
-                    return None if not is_required else 0
-                return int(value)
+        if field_type == "str":
+            return widget.get()
                 
-            elif field_type == "float":
-                value = widget.get()
-                # Se o valor estiver vazio e não for um campo obrigatório, permitir null
-                if not value:
-                    is_required = field_info.get("required", False)
-                    return None if not is_required else 0.0
-                return float(value)
+        elif field_type == "int":
+            value = widget.get()
+            # Se o valor estiver vazio e não for um campo obrigatório, permitir null
+            if not value:
+                is_required = field_info.required
+                return None if not is_required else 0
+            return int(value)
                 
-            elif field_type == "bool":
-                return widget.var.get()
+        elif field_type == "float":
+            value = widget.get()
+            # Se o valor estiver vazio e não for um campo obrigatório, permitir null
+            if not value:
+                is_required = field_info.required
+                return None if not is_required else 0.0
+            # O validador de digitação aceita vírgula como separador
+            return float(value.translate(_COMMA_TO_DOT))
                 
-            elif field_type == "list" or field_type.startswith("list["):
-                # Coletar valores dos campos de entrada
-                list_values = []
-                inner_type = field_type[5:-1] if field_type.startswith("list[") else None
+        elif field_type == "bool":
+            return self._bool_vars[field_name].get()
                 
-                for entry_widget in widget.entries:
-                    value = entry_widget.get().strip()
-                    if value:  # Ignorar entradas vazias
-                        # Converter para o tipo correto
-                        if inner_type == "int":
-                            try:
-                                value = int(value)
-                            except ValueError:
-                                raise ValueError(f"O valor '{value}' não é um número inteiro válido")
-                        elif inner_type == "float":
-                            try:
-                                value = float(value)
-                            except ValueError:
-                                raise ValueError(f"O valor '{value}' não é um número válido")
-                        elif inner_type == "bool":
-                            value = value.lower()
-                            if value in ("true", "verdadeiro", "1", "sim", "s", "t"):
-                                value = True
-                            elif value in ("false", "falso", "0", "não", "nao", "n", "f"):
-                                value = False
-                            else:
-                                raise ValueError(f"O valor '{value}' não é um booleano válido")
-                        # Para string, mantemos como está
-                        list_values.append(value)
+        elif field_info.is_list:
+            # Coletar valores dos campos de entrada (ou linhas do
+            # editor de texto, para listas grandes)
+            list_values = []
+            inner_type = field_info.inner_type
+
+            if isinstance(widget, tk.Text):
+                self._flush_text_stream(widget)
+                raw_values = widget.get("1.0", "end-1c").splitlines()
+            else:
+                # Atualizar o espelho a partir dos widgets uma única vez:
+                # texto pode entrar num Entry sem KeyRelease (colagem via
+                # seleção primária, por exemplo) e escapar dos eventos
+                # espelhados; na hora de salvar os widgets são a fonte
+                widget.value_list[:] = [entry.get() for entry in widget.entries]
+                raw_values = widget.value_list
+
+            for raw_value in raw_values:
+                value = raw_value.strip()
+                if value:  # Ignorar entradas vazias
+                    # Converter para o tipo correto
+                    if inner_type == "int":
+                        try:
+                            value = int(value)
+                        except ValueError:
+                            raise ValueError(f"O valor '{value}' não é um número inteiro válido")
+                    elif inner_type == "float":
+                        try:
+                            value = float(value)
+                        except ValueError:
+                            raise ValueError(f"O valor '{value}' não é um número válido")
+                    elif inner_type == "bool":
+                        bool_value = _BOOL_MAP.get(value.lower())
+                        if bool_value is None:
+                            raise ValueError(f"O valor '{value}' não é um booleano válido")
+                        value = bool_value
+                    # Para string, mantemos como está
+                    list_values.append(value)
                 
-                return list_values
+            return list_values
                 
-            elif field_type == "dict" or field_type == "object":
-                # Verificar se este widget usa a interface estruturada (botão "Editar Estrutura")
-                if hasattr(widget, 'field_specs') and hasattr(widget, 'dict_value'):
-                    return widget.dict_value
+        elif field_type == "dict" or field_type == "object":
+            # Verificar se este widget usa a interface estruturada (botão "Editar Estrutura")
+            if hasattr(widget, 'field_specs') and hasattr(widget, 'dict_value'):
+                return widget.dict_value
+            else:
+                # Usar a lógica para widgets de dicionário genérico (com pares chave-valor)
+                dict_values = {}
+                if isinstance(widget, tk.Text):
+                    # Editor de texto para dicionários grandes: uma
+                    # linha "chave=valor" por par
+                    self._flush_text_stream(widget)
+                    pairs = []
+                    for line in widget.get("1.0", "end-1c").splitlines():
+                        raw_key, sep, raw_value = line.partition("=")
+                        if sep:
+                            pairs.append((raw_key, raw_value))
+                elif hasattr(widget, 'entries'):
+                    # Atualizar os espelhos a partir dos widgets antes de
+                    # ler, pelo mesmo motivo do caso das listas
+                    widget.key_list[:] = [k.get() for k, _ in widget.entries]
+                    widget.val_list[:] = [v.get() for _, v in widget.entries]
+                    pairs = zip(widget.key_list, widget.val_list)
                 else:
-                    # Usar a lógica para widgets de dicionário genérico (com pares chave-valor)
-                    dict_values = {}
-                    if hasattr(widget, 'entries'):
-                        for key_widget, value_widget in widget.entries:
-                            key = key_widget.get().strip()
-                            value = value_widget.get().strip()
-                            
-                            if key:
-                                # Tentar detectar o tipo do valor automaticamente
-                                if not value:
-                                    dict_values[key] = value
-                                elif value.lower() in ("true", "verdadeiro", "1", "sim", "s", "t"):
-                                    dict_values[key] = True
-                                elif value.lower() in ("false", "falso", "0", "não", "nao", "n", "f"):
-                                    dict_values[key] = False
-                                else:
-                                    try:
-                                        if "." in value or "," in value:
-                                            value = value.replace(",", ".")
-                                            dict_values[key] = float(value)
-                                        else:
-                                            dict_values[key] = int(value)
-                                    except ValueError:
-                                        dict_values[key] = value
-                    return dict_values
+                    pairs = []
+
+                for raw_key, raw_value in pairs:
+                    key = raw_key.strip()
+                    value = raw_value.strip()
+
+                    if key:
+                        # Tentar detectar o tipo do valor automaticamente
+                        bool_value = _BOOL_MAP.get(value.lower())
+                        if not value:
+                            dict_values[key] = value
+                        elif bool_value is not None:
+                            dict_values[key] = bool_value
+                        elif _NUM_RE.match(value):
+                            normalized = value.translate(_COMMA_TO_DOT)
+                            if "." in normalized:
+                                dict_values[key] = float(normalized)
+                            else:
+                                dict_values[key] = int(normalized)
+                        else:
+                            dict_values[key] = value
+                return dict_values
                 
-            return None
-            
-        except Exception as e:
-            messagebox.showerror(
-                "Erro ao obter valor", 
-                f"Erro ao obter valor do campo {field_name}: {str(e)}"
-            )
-            return None
-    
+        return None
+
     def save(self):
         """Salva os valores editados."""
+        # Garantir que campos ainda não renderizados existam antes de ler
+        self._flush_deferred_rows()
+
         result = {}
         errors = []
-        
+
+        # Com validation.fail_fast, interromper no primeiro erro em vez
+        # de acumular e formatar todos
+        fail_fast = get_config("validation.fail_fast", False)
+
         # Coletar valores de todos os campos
-        for field_name, field_info in self.field_widgets.items():
+        for field_name in self.field_widgets:
             try:
-                value = self.get_field_value(field_name)
-                
-                # Validar campos obrigatórios
-                if field_info["required"] and (value is None or (isinstance(value, str) and value.strip() == "")):
-                    errors.append(f"O campo '{field_name}' é obrigatório")
-                    continue
-                
-                # Validar tipo para listas tipadas
-                field_type = field_info["type"]
-                if field_type.startswith("list[") and value:
-                    inner_type = field_type[5:-1]
-                    
-                    for i, item in enumerate(value):
-                        if inner_type == "str" and not isinstance(item, str):
-                            errors.append(f"Item {i} em '{field_name}' deve ser do tipo string")
-                        elif inner_type == "int" and not isinstance(item, int):
-                            errors.append(f"Item {i} em '{field_name}' deve ser do tipo inteiro")
-                        elif inner_type == "float" and not isinstance(item, (int, float)):
-                            errors.append(f"Item {i} em '{field_name}' deve ser do tipo número")
-                        elif inner_type == "bool" and not isinstance(item, bool):
-                            errors.append(f"Item {i} em '{field_name}' deve ser do tipo booleano")
-                
-                # Adicionar ao resultado
-                result[field_name] = value
-                
+                result[field_name] = self.get_field_value(field_name)
             except Exception as e:
                 errors.append(f"Erro no campo '{field_name}': {str(e)}")
-        
+                if fail_fast:
+                    break
+
+        # Validar com o validador pré-compilado do modelo (campos
+        # obrigatórios e tipos internos de listas tipadas)
+        if not errors and self._validator is not None:
+            errors.extend(self._validator(result))
+
         # Exibir erros, se houver
         if errors:
-            error_msg = "\n".join(errors)
+            error_msg = errors[0] if fail_fast else "\n".join(errors)
             messagebox.showerror("Erros de validação", error_msg)
             return
         
         # Armazenar resultado
         self.result = result
-        self.destroy()
-    
+        self._close()
+
     def cancel(self):
         """Cancela a edição."""
         self.result = None
-        self.destroy()
-        
-    def add_list_item(self, widget, list_frame, value=None):
-        """Adiciona um novo item à lista."""
-        # Frame para o item
-        item_frame = ttk.Frame(list_frame)
-        item_frame.pack(fill="x", pady=2, padx=2)
-        
-        # Entrada para o valor do item
-        entry = ttk.Entry(item_frame)
-        entry.pack(side="left", fill="x", expand=True)
+        self._close()
         
+    def add_list_item(self, widget, list_frame, value=None, _bulk=False):
+        """
+        Adiciona um novo item à lista.
+
+        Com _bulk=True a atualização da região de rolagem é pulada; o
+        chamador deve atualizá-la uma única vez após o laço.
+        """
+        if widget.row_pool:
+            # Reutilizar uma linha previamente removida
+            item_frame, entry = widget.row_pool.pop()
+            entry.delete(0, "end")
+            item_frame.pack(fill="x", pady=2, padx=2)
+        else:
+            # Frame para o item
+            item_frame = ttk.Frame(list_frame)
+            item_frame.pack(fill="x", pady=2, padx=2)
+
+            # Entrada para o valor do item
+            entry = ttk.Entry(item_frame)
+            entry.pack(side="left", fill="x", expand=True)
+            entry.bind("<KeyRelease>", self._sync_mirror)
+            entry.bind("<FocusOut>", self._sync_mirror)
+
         # Preencher com o valor, se fornecido
         if value is not None:
-            entry.insert(0, str(value))
-            
+            entry.insert(0, _to_entry_text(value))
+
+        # Manter o espelho em Python sincronizado com a nova linha
+        entry._mirror = widget.value_list
+        entry._mirror_index = len(widget.entries)
+        widget.value_list.append(str(value) if value is not None else "")
+
         # Adicionar à lista de entradas
         widget.entries.append(entry)
-        
+
         # Atualizar a região de rolagem
-        widget.canvas.update_idletasks()
-        widget.canvas.configure(scrollregion=widget.canvas.bbox("all"))
-        
+        if not _bulk:
+            self._update_scroll_region(widget)
+
         return entry
         
+    def _stream_into_text(self, widget):
+        """
+        Insere o próximo lote de linhas no editor de texto e reagenda o
+        restante via after_idle, até esgotar o iterador.
+        """
+        if not widget.winfo_exists():
+            return
+
+        chunk = list(islice(widget._line_iter, self.STREAM_CHUNK))
+        if not chunk:
+            widget._line_iter = None
+            return
+
+        if widget.index("end-1c") != "1.0":
+            widget.insert("end", "\n")
+        widget.insert("end", "\n".join(chunk))
+        self.after_idle(self._stream_into_text, widget)
+
+    def _flush_text_stream(self, widget):
+        """Completa imediatamente um preenchimento em lotes pendente."""
+        lines = getattr(widget, "_line_iter", None)
+        if lines is not None:
+            remaining = list(lines)
+            if remaining:
+                if widget.index("end-1c") != "1.0":
+                    widget.insert("end", "\n")
+                widget.insert("end", "\n".join(remaining))
+            widget._line_iter = None
+
+    def _mark_dirty(self, event):
+        """Marca como modificado o campo dono do widget que gerou o evento."""
+        widget = event.widget
+        while widget is not None and widget is not self:
+            field = self._widget_field.get(str(widget))
+            if field is not None:
+                self._dirty.add(field)
+                return
+            widget = widget.master
+
+    def reopen(self, current_values, theme=None):
+        """Reexibe o diálogo reaproveitando os widgets já construídos."""
+        self.result = None
+
+        # Reaplicar o tema: o usuário pode ter alternado claro/escuro
+        # desde a última abertura
+        if theme is not None and theme != self.theme:
+            self.theme = theme
+            bg = theme.get("bg", "#F0F0F0")
+            self.configure(bg=bg)
+            self._canvas.configure(bg=bg)
+
+        self._reset_values(current_values)
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+        self.focus_set()
+
+    def _reset_values(self, current_values):
+        """Atualiza os widgets já construídos com os valores de outra entrada."""
+        self.current_values = current_values or {}
+        self._dirty.clear()
+
+        for field, field_info in self.field_widgets.items():
+            widget = field_info.widget
+            field_type = field_info.type
+            value = self.current_values.get(field)
+
+            if field_type == "bool":
+                self._bool_vars[field].set(bool(value) if value is not None else False)
+
+            elif isinstance(widget, tk.Text):
+                widget.delete("1.0", "end")
+                if field_info.is_list:
+                    widget._line_iter = (str(item) for item in (value or []))
+                else:
+                    widget._line_iter = (
+                        f"{key}={item}" for key, item in (value or {}).items())
+                self._stream_into_text(widget)
+
+            elif field_info.is_list:
+                self._reset_list_rows(widget, value)
+
+            elif field_type == "dict" or field_type == "object":
+                if hasattr(widget, 'field_specs'):
+                    widget.dict_value = value if value else {}
+                    if isinstance(value, dict) and value:
+                        widget.preview_label.configure(text=f"{{{len(value)} campos}}")
+                    else:
+                        widget.preview_label.configure(text="{}")
+                else:
+                    self._reset_dict_rows(widget, value)
+
+            else:
+                widget.delete(0, "end")
+                if value is not None:
+                    widget.insert(0, _to_entry_text(value))
+                elif field_type == "int":
+                    widget.insert(0, "0")
+                elif field_type == "float":
+                    widget.insert(0, "0.0")
+
+    def _reset_list_rows(self, widget, value):
+        """Repovoa as linhas de um widget de lista com novos itens."""
+        # Devolver todas as linhas atuais ao pool de uma vez
+        while widget.entries:
+            entry = widget.entries.pop()
+            entry._mirror_index = None
+            entry.master.pack_forget()
+            widget.row_pool.append((entry.master, entry))
+        widget.value_list.clear()
+
+        items = value if isinstance(value, list) else []
+        for item in items:
+            self.add_list_item(widget, widget.list_frame, item, _bulk=True)
+        if not widget.entries:
+            self.add_list_item(widget, widget.list_frame, _bulk=True)
+        self._update_scroll_region(widget)
+
+    def _reset_dict_rows(self, widget, value):
+        """Repovoa as linhas de um widget de dicionário com novos pares."""
+        while widget.entries:
+            key_entry, value_entry = widget.entries.pop()
+            key_entry._mirror_index = None
+            value_entry._mirror_index = None
+            key_entry.master.pack_forget()
+            widget.row_pool.append((key_entry.master, key_entry, value_entry))
+        widget.key_list.clear()
+        widget.val_list.clear()
+
+        pairs = value if isinstance(value, dict) else {}
+        for key, item in pairs.items():
+            self.add_dict_pair(widget, widget.dict_frame, key, item, _bulk=True)
+        if not widget.entries:
+            self.add_dict_pair(widget, widget.dict_frame, _bulk=True)
+        self._update_scroll_region(widget)
+
+    def _close(self):
+        """Fecha o diálogo, ocultando-o quando a instância é reutilizável."""
+        if self._reusable:
+            self.grab_release()
+            self.withdraw()
+            self._closed.set(True)
+        else:
+            self.destroy()
+
+    def _sync_mirror(self, event):
+        """Espelha o conteúdo de um Entry na lista Python correspondente."""
+        entry = event.widget
+        index = entry._mirror_index
+        # Linhas devolvidas ao pool mantêm os bindings, mas não têm mais
+        # posição no espelho; um FocusOut tardio (a linha removida ainda
+        # com foco) não deve escrever em slot alheio
+        if index is not None and index < len(entry._mirror):
+            entry._mirror[index] = entry.get()
+
+    def _update_scroll_region(self, widget):
+        """Recalcula a região de rolagem do canvas de um widget composto."""
+        widget.canvas.update_idletasks()
+        widget.canvas.configure(scrollregion=widget.canvas.bbox("all"))
+
     def remove_list_item(self, widget):
         """Remove o último item da lista."""
         if widget.entries:
-            # Remover o último widget de entrada
+            # Remover o último widget de entrada, devolvendo a linha ao
+            # pool em vez de destruí-la
             entry = widget.entries.pop()
-            entry.master.destroy()  # Destruir o frame pai
-            
+            widget.value_list.pop()
+            entry._mirror_index = None
+            entry.master.pack_forget()
+            widget.row_pool.append((entry.master, entry))
+
             # Atualizar a região de rolagem
-            widget.canvas.update_idletasks()
-            widget.canvas.configure(scrollregion=widget.canvas.bbox("all"))
+            self._update_scroll_region(widget)
             
-    def add_dict_pair(self, widget, dict_frame, key=None, value=None):
-        """Adiciona um novo par chave-valor ao dicionário."""
-        # Frame para o par
-        pair_frame = ttk.Frame(dict_frame)
-        pair_frame.pack(fill="x", pady=2, padx=2)
-        
-        # Entrada para a chave
-        key_entry = ttk.Entry(pair_frame, width=15)
-        key_entry.pack(side="left", padx=(0, 5))
-        ttk.Label(pair_frame, text=":").pack(side="left", padx=2)
-        
-        # Entrada para o valor
-        value_entry = ttk.Entry(pair_frame)
-        value_entry.pack(side="left", fill="x", expand=True)
-        
+    def add_dict_pair(self, widget, dict_frame, key=None, value=None, _bulk=False):
+        """
+        Adiciona um novo par chave-valor ao dicionário.
+
+        Com _bulk=True a atualização da região de rolagem é pulada; o
+        chamador deve atualizá-la uma única vez após o laço.
+        """
+        if widget.row_pool:
+            # Reutilizar uma linha previamente removida
+            pair_frame, key_entry, value_entry = widget.row_pool.pop()
+            key_entry.delete(0, "end")
+            value_entry.delete(0, "end")
+            pair_frame.pack(fill="x", pady=2, padx=2)
+        else:
+            # Frame para o par
+            pair_frame = ttk.Frame(dict_frame)
+            pair_frame.pack(fill="x", pady=2, padx=2)
+
+            # Entrada para a chave
+            key_entry = ttk.Entry(pair_frame, width=15)
+            key_entry.pack(side="left", padx=(0, 5))
+            ttk.Label(pair_frame, text=":").pack(side="left", padx=2)
+
+            # Entrada para o valor
+            value_entry = ttk.Entry(pair_frame)
+            value_entry.pack(side="left", fill="x", expand=True)
+
+            for entry in (key_entry, value_entry):
+                entry.bind("<KeyRelease>", self._sync_mirror)
+                entry.bind("<FocusOut>", self._sync_mirror)
+
         # Preencher com os valores, se fornecidos
         if key is not None:
-            key_entry.insert(0, str(key))
+            key_entry.insert(0, _to_entry_text(key))
         if value is not None:
-            value_entry.insert(0, str(value))
-            
+            value_entry.insert(0, _to_entry_text(value))
+
+        # Manter os espelhos em Python sincronizados com a nova linha
+        index = len(widget.entries)
+        key_entry._mirror = widget.key_list
+        key_entry._mirror_index = index
+        value_entry._mirror = widget.val_list
+        value_entry._mirror_index = index
+        widget.key_list.append(str(key) if key is not None else "")
+        widget.val_list.append(str(value) if value is not None else "")
+
         # Adicionar à lista de entradas
         widget.entries.append((key_entry, value_entry))
-        
+
         # Atualizar a região de rolagem
-        widget.canvas.update_idletasks()
-        widget.canvas.configure(scrollregion=widget.canvas.bbox("all"))
-        
+        if not _bulk:
+            self._update_scroll_region(widget)
+
         return key_entry, value_entry
         
     def remove_dict_pair(self, widget):
         """Remove o último par do dicionário."""
         if widget.entries:
-            # Remover o último par de widgets
-            pair = widget.entries.pop()
-            pair[0].master.destroy()  # Destruir o frame pai
-            
+            # Remover o último par de widgets, devolvendo a linha ao pool
+            key_entry, value_entry = widget.entries.pop()
+            widget.key_list.pop()
+            widget.val_list.pop()
+            key_entry._mirror_index = None
+            value_entry._mirror_index = None
+            key_entry.master.pack_forget()
+            widget.row_pool.append((key_entry.master, key_entry, value_entry))
+
             # Atualizar a região de rolagem
-            widget.canvas.update_idletasks()
-            widget.canvas.configure(scrollregion=widget.canvas.bbox("all"))
+            self._update_scroll_region(widget)
             
     def open_dict_dialog(self, widget, preview_label):
         """Abre um diálogo para editar um dicionário com campos definidos."""
@@ -7,10 +7,12 @@ from json_model import JsonModel, JsonModelError
 class TestJsonModel(unittest.TestCase):
     """Testes para a classe JsonModel."""
     
-    def setUp(self):
-        """Configuração para cada teste."""
+    @classmethod
+    def setUpClass(cls):
+        """Configuração única para a classe: os testes não mutam o modelo,
+        então o arquivo temporário é escrito uma vez em vez de a cada teste."""
         # Criar modelo de teste
-        self.test_meta = {
+        cls.test_meta = {
             "__meta__": {
                 "name": {"type": "str", "required": True},
                 "email": {"type": "str", "required": False},
@@ -19,19 +21,20 @@ class TestJsonModel(unittest.TestCase):
                 "tags": {"type": "list[str]", "required": False}
             }
         }
-        
+
         # Criar arquivo temporário de modelo
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode="w+")
-        json.dump(self.test_meta, self.temp_file)
-        self.temp_file.close()
-        
+        cls.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode="w+")
+        json.dump(cls.test_meta, cls.temp_file)
+        cls.temp_file.close()
+
         # Instanciar modelo a partir do dicionário
-        self.model = JsonModel(model_dict=self.test_meta)
-    
-    def tearDown(self):
-        """Limpeza após cada teste."""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+        cls.model = JsonModel(model_dict=cls.test_meta)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Limpeza única após todos os testes da classe."""
+        if os.path.exists(cls.temp_file.name):
+            os.unlink(cls.temp_file.name)
     
     def test_load_model_from_file(self):
         """Testa o carregamento do modelo a partir de um arquivo."""
@@ -131,6 +134,22 @@ class TestJsonModel(unittest.TestCase):
         self.assertEqual(empty_entry["age"], None)
         self.assertEqual(empty_entry["tags"], None)
     
+    def test_compile_validator(self):
+        """Testa o validador pré-compilado do modelo."""
+        validate = self.model.compile_validator()
+
+        # A mesma função deve ser reutilizada em chamadas subsequentes
+        self.assertIs(validate, self.model.compile_validator())
+
+        # Entrada válida não deve gerar erros
+        errors = validate({"name": "Teste", "active": True, "tags": ["a", "b"]})
+        self.assertEqual(len(errors), 0)
+
+        # Campo obrigatório ausente e item de lista com tipo incorreto
+        errors = validate({"name": "", "active": True, "tags": ["a", 123]})
+        self.assertTrue(any("'name'" in error for error in errors))
+        self.assertTrue(any("'tags'" in error for error in errors))
+
     def test_get_field_names(self):
         """Testa a obtenção dos nomes dos campos."""
         field_names = self.model.get_field_names()